@@ -27,6 +27,25 @@ class User(EmailAccountsUser):
     class Meta:
         proxy = True
 
+    @property
+    def packages(self):
+        """
+        The packages the user is subscribed to with any of their associated
+        emails.
+
+        The subscriptions are looked up in a subquery so that the database
+        resolves the relation in a single query without having to remove
+        duplicates.
+
+        :rtype: :class:`QuerySet <django.db.models.query.QuerySet>` of
+            :class:`distro_tracker.core.models.PackageName` instances
+        """
+        from distro_tracker.core.models import PackageName, Subscription
+        subscriptions = Subscription.objects.filter(
+            email_settings__user_email__user=self)
+        return PackageName.objects.filter(
+            id__in=subscriptions.values('package_id'))
+
     def is_subscribed_to(self, package):
         """
         Checks if the user is subscribed to the given package. The user is
@@ -36,22 +55,25 @@ class User(EmailAccountsUser):
         :param package: The name of the package or a package instance
         :type package: string or :class:`distro_tracker.core.models.PackageName`
         """
-        from distro_tracker.core.models import PackageName
-        if not isinstance(package, PackageName):
-            try:
-                package = PackageName.objects.get(name=package)
-            except PackageName.DoesNotExist:
-                return False
-        qs = package.subscriptions.filter(user_email__in=self.emails.all())
-        return qs.exists()
+        from distro_tracker.core.models import PackageName, Subscription
+        if isinstance(package, PackageName):
+            package_lookup = {'package': package}
+        else:
+            package_lookup = {'package__name': package}
+        return Subscription.objects.filter(
+            email_settings__user_email__user_id=self.pk,
+            **package_lookup).exists()
 
     def unsubscribe_all(self, email=None):
         """
         Terminate the user's subscription associated to the given
         email. Uses the main email if not specified.
+
+        Nothing is removed if the email does not belong to the user.
         """
+        from distro_tracker.core.models import Subscription
         if not email:
             email = self.main_email
-        user_email = UserEmail.objects.get(email=email)
-        if self.emails.filter(pk=user_email.id).exists():
-            user_email.emailsettings.subscription_set.all().delete()
+        Subscription.objects.filter(
+            email_settings__user_email__email=email,
+            email_settings__user_email__user=self).delete()
@@ -152,6 +152,39 @@ class UserTests(TestCase):
     def test_is_subscribed_to_on_non_existing_package(self):
         self.assertFalse(self.user.is_subscribed_to('does-not-exist'))
 
+    def test_is_subscribed_to_package_name_single_query(self):
+        Subscription.objects.create_for(
+            email=self.main_email,
+            package_name=self.package.name)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(self.user.is_subscribed_to('dummy-package'))
+
+    def test_packages(self):
+        """
+        Tests the :attr:`packages
+        <distro_tracker.accounts.models.User.packages>` property when the
+        user is subscribed to the same package with several emails.
+        """
+        other_package = PackageName.objects.create(name='other-package')
+        PackageName.objects.create(name='not-subscribed')
+        self.user.emails.create(email='other-email@domain.com')
+        for email in self.user.emails.all():
+            Subscription.objects.create_for(
+                email=email.email,
+                package_name=self.package.name)
+        Subscription.objects.create_for(
+            email=self.main_email,
+            package_name=other_package.name)
+
+        with self.assertNumQueries(1):
+            packages = sorted(pkg.name for pkg in self.user.packages)
+
+        self.assertEqual(packages, ['dummy-package', 'other-package'])
+
+    def test_packages_no_subscriptions(self):
+        self.assertFalse(self.user.packages.exists())
+
     def test_unsubscribe_all(self):
         """
         Test the :meth:`unsubscribe_all
@@ -181,6 +214,33 @@ class UserTests(TestCase):
             'unsubscribe_all(email) should remove all subscriptions of '
             ' that email')
 
+    def test_unsubscribe_all_email_of_other_user(self):
+        """
+        Tests that :meth:`unsubscribe_all
+        <distro_tracker.accounts.models.User.unsubscribe_all>` does not
+        remove subscriptions of an email which belongs to another user.
+        """
+        other_email = 'other-user@domain.com'
+        User.objects.create_user(main_email=other_email, password='asdf')
+        Subscription.objects.create_for(
+            email=other_email,
+            package_name=self.package.name)
+
+        self.user.unsubscribe_all(other_email)
+
+        self.assertEqual(
+            len(Subscription.objects.get_for_email(other_email)), 1)
+
+    def test_unsubscribe_all_unknown_email(self):
+        Subscription.objects.create_for(
+            email=self.main_email,
+            package_name=self.package.name)
+
+        self.user.unsubscribe_all('does-not-exist@domain.com')
+
+        self.assertEqual(
+            len(Subscription.objects.get_for_email(self.main_email)), 1)
+
 
 class SubscriptionsViewTests(TestCase):
     """
@@ -0,0 +1,89 @@
+# Copyright 2013 The Distro Tracker Developers
+# See the COPYRIGHT file at the top-level directory of this distribution and
+# at https://deb.li/DTAuthors
+#
+# This file is part of Distro Tracker. It is subject to the license terms
+# in the LICENSE file found in the top-level directory of this
+# distribution and at https://deb.li/DTLicense. No part of Distro Tracker,
+# including this file, may be copied, modified, propagated, or distributed
+# except according to the terms contained in the LICENSE file.
+"""The URL routes included below ``accounts/``."""
+
+from django.urls import path
+from django.views.generic import TemplateView
+
+from distro_tracker.accounts.views import (
+    AccountMergeConfirmView,
+    AccountMergeConfirmedView,
+    AccountMergeFinalize,
+    AccountProfile,
+    ChangePersonalInfoView,
+    ChooseSubscriptionEmailView,
+    ConfirmAddAccountEmail,
+    ForgotPasswordView,
+    LoginView,
+    LogoutView,
+    ManageAccountEmailsView,
+    ModifyKeywordsView,
+    PasswordChangeView,
+    RegisterUser,
+    RegistrationConfirmation,
+    ResetPasswordView,
+    SubscriptionsView
+)
+
+urlpatterns = [
+    path('register/', RegisterUser.as_view(),
+         name='dtracker-accounts-register'),
+    path('+reset-password/+success/',
+         TemplateView.as_view(
+             template_name='accounts/password-reset-success.html'
+         ),
+         name='dtracker-accounts-password-reset-success'),
+    path('+reset-password/<path:confirmation_key>/',
+         ResetPasswordView.as_view(),
+         name='dtracker-accounts-reset-password'),
+    path('+forgot-password/', ForgotPasswordView.as_view(),
+         name='dtracker-accounts-forgot-password'),
+    path('register/success/',
+         TemplateView.as_view(template_name='accounts/success.html'),
+         name='dtracker-accounts-register-success'),
+    path('+manage-emails/', ManageAccountEmailsView.as_view(),
+         name='dtracker-accounts-manage-emails'),
+    path('+confirm-new-email/<path:confirmation_key>/',
+         ConfirmAddAccountEmail.as_view(),
+         name='dtracker-accounts-confirm-add-email'),
+    path('+merge-accounts/confirm/',
+         AccountMergeConfirmView.as_view(),
+         name='dtracker-accounts-merge-confirmation'),
+    path('+merge-accounts/confirmed/',
+         AccountMergeConfirmedView.as_view(),
+         name='dtracker-accounts-merge-confirmed'),
+    path('+merge-accounts/finalize/<path:confirmation_key>/',
+         AccountMergeFinalize.as_view(),
+         name='dtracker-accounts-merge-finalize'),
+    path('+merge-accounts/finalized/',
+         TemplateView.as_view(
+             template_name='accounts/accounts-merge-finalized.html'),
+         name='dtracker-accounts-merge-finalized'),
+    path('confirm/<confirmation_key>',
+         RegistrationConfirmation.as_view(),
+         name='dtracker-accounts-confirm-registration'),
+    path('profile/', AccountProfile.as_view(),
+         name='dtracker-accounts-profile'),
+    path('subscriptions/', SubscriptionsView.as_view(),
+         name='dtracker-accounts-subscriptions'),
+    path('profile/subscriptions/choose-subscription-email/',
+         ChooseSubscriptionEmailView.as_view(),
+         name='dtracker-accounts-choose-email'),
+    path('login/', LoginView.as_view(),
+         name='dtracker-accounts-login'),
+    path('logout/', LogoutView.as_view(),
+         name='dtracker-accounts-logout'),
+    path('profile/modify/', ChangePersonalInfoView.as_view(),
+         name='dtracker-accounts-profile-modify'),
+    path('profile/password-change/', PasswordChangeView.as_view(),
+         name='dtracker-accounts-profile-password-change'),
+    path('profile/keywords', ModifyKeywordsView.as_view(),
+         name='dtracker-accounts-profile-keywords'),
+]
@@ -0,0 +1,50 @@
+# Copyright 2013 The Distro Tracker Developers
+# See the COPYRIGHT file at the top-level directory of this distribution and
+# at https://deb.li/DTAuthors
+#
+# This file is part of Distro Tracker. It is subject to the license terms
+# in the LICENSE file found in the top-level directory of this
+# distribution and at https://deb.li/DTLicense. No part of Distro Tracker,
+# including this file, may be copied, modified, propagated, or distributed
+# except according to the terms contained in the LICENSE file.
+"""The URL routes included below ``api/``."""
+
+from django.urls import path
+
+from distro_tracker.accounts.views import (
+    ModifyKeywordsView,
+    SubscribeUserToPackageView,
+    UnsubscribeAllView,
+    UnsubscribeUserView,
+    UserEmailsView
+)
+from distro_tracker.core.views import (
+    ActionItemJsonView,
+    KeywordsView,
+    PackageAutocompleteView,
+    TeamAutocompleteView
+)
+
+urlpatterns = [
+    path('package/search/autocomplete', PackageAutocompleteView.as_view(),
+         name='dtracker-api-package-autocomplete'),
+    path('action-items/<int:item_pk>', ActionItemJsonView.as_view(),
+         name='dtracker-api-action-item'),
+    path('keywords/', KeywordsView.as_view(),
+         name='dtracker-api-keywords'),
+    path('teams/search/autocomplete', TeamAutocompleteView.as_view(),
+         name='dtracker-api-team-autocomplete'),
+
+    path('accounts/profile/emails/', UserEmailsView.as_view(),
+         name='dtracker-api-accounts-emails'),
+    path('accounts/profile/subscribe/',
+         SubscribeUserToPackageView.as_view(),
+         name='dtracker-api-accounts-subscribe'),
+    path('accounts/profile/unsubscribe/', UnsubscribeUserView.as_view(),
+         name='dtracker-api-accounts-unsubscribe'),
+    path('accounts/profile/unsubscribe-all/',
+         UnsubscribeAllView.as_view(),
+         name='dtracker-api-accounts-unsubscribe-all'),
+    path('accounts/profile/keywords/', ModifyKeywordsView.as_view(),
+         name='dtracker-api-accounts-profile-keywords'),
+]
@@ -3,6 +3,57 @@
 from django.db import models, migrations
 
 
+KEYWORDS = (
+    ('default', True),
+    ('bts', True),
+    ('bts-control', True),
+    ('summary', True),
+    ('upload-source', True),
+    ('archive', True),
+    ('contact', True),
+    ('build', True),
+    ('vcs', False),
+    ('translation', False),
+    ('upload-binary', False),
+    ('derivatives', False),
+    ('derivatives-bugs', False),
+)
+
+ARCHITECTURES = (
+    'amd64',
+    'armel',
+    'armhf',
+    'hurd-i386',
+    'i386',
+    'ia64',
+    'kfreebsd-amd64',
+    'kfreebsd-i386',
+    'mips',
+    'mipsel',
+    'powerpc',
+    's390',
+    's390x',
+    'sparc',
+    'all',
+    'any',
+)
+
+MAILING_LISTS = (
+    ('debian', 'lists.debian.org',
+     'https://lists.debian.org/{user}/'),
+    ('alioth-debian', 'lists.alioth.debian.org',
+     'https://lists.alioth.debian.org/pipermail/{user}/'),
+    ('ubuntu', 'lists.ubuntu.com',
+     'https://lists.ubuntu.com/archives/{user}/'),
+    ('riseup', 'lists.riseup.net',
+     'https://lists.riseup.net/www/arc/{user}'),
+    ('launchpad', 'lists.launchpad.net',
+     'https://lists.launchpad.net/{user}/'),
+    ('freedesktop', 'lists.freedesktop.org',
+     'https://lists.freedesktop.org/archives/{user}/'),
+)
+
+
 def forwards_func(apps, schema_editor):
     # We get the model from the versioned app registry;
     # if we directly import it, it'll be the wrong version
@@ -11,52 +62,18 @@ def forwards_func(apps, schema_editor):
     MailingList = apps.get_model('core', 'MailingList')
     db_alias = schema_editor.connection.alias
     Keyword.objects.using(db_alias).bulk_create([
-        Keyword(name='default', default=True),
-        Keyword(name='bts', default=True),
-        Keyword(name='bts-control', default=True),
-        Keyword(name='summary', default=True),
-        Keyword(name='upload-source', default=True),
-        Keyword(name='archive', default=True),
-        Keyword(name='contact', default=True),
-        Keyword(name='build', default=True),
-        Keyword(name='vcs', default=False),
-        Keyword(name='translation', default=False),
-        Keyword(name='upload-binary', default=False),
-        Keyword(name='derivatives', default=False),
-        Keyword(name='derivatives-bugs', default=False),
-    ])
+        Keyword(name=name, default=default)
+        for name, default in KEYWORDS
+    ], batch_size=500, ignore_conflicts=True)
     Architecture.objects.using(db_alias).bulk_create([
-        Architecture(name='amd64'),
-        Architecture(name='armel'),
-        Architecture(name='armhf'),
-        Architecture(name='hurd-i386'),
-        Architecture(name='i386'),
-        Architecture(name='ia64'),
-        Architecture(name='kfreebsd-amd64'),
-        Architecture(name='kfreebsd-i386'),
-        Architecture(name='mips'),
-        Architecture(name='mipsel'),
-        Architecture(name='powerpc'),
-        Architecture(name='s390'),
-        Architecture(name='s390x'),
-        Architecture(name='sparc'),
-        Architecture(name='all'),
-        Architecture(name='any'),
-    ])
+        Architecture(name=name)
+        for name in ARCHITECTURES
+    ], batch_size=500, ignore_conflicts=True)
     MailingList.objects.using(db_alias).bulk_create([
-        MailingList(name='debian', domain='lists.debian.org',
-                    archive_url_template='https://lists.debian.org/{user}/'),
-        MailingList(name='alioth-debian', domain='lists.alioth.debian.org',
-                    archive_url_template='https://lists.alioth.debian.org/pipermail/{user}/'),
-        MailingList(name='ubuntu', domain='lists.ubuntu.com',
-                    archive_url_template='https://lists.ubuntu.com/archives/{user}/'),
-        MailingList(name='riseup', domain='lists.riseup.net',
-                    archive_url_template='https://lists.riseup.net/www/arc/{user}'),
-        MailingList(name='launchpad', domain='lists.launchpad.net',
-                    archive_url_template='https://lists.launchpad.net/{user}/'),
-        MailingList(name='freedesktop', domain='lists.freedesktop.org',
-                    archive_url_template='https://lists.freedesktop.org/archives/{user}/'),
-    ])
+        MailingList(name=name, domain=domain,
+                    archive_url_template=archive_url_template)
+        for name, domain, archive_url_template in MAILING_LISTS
+    ], batch_size=500, ignore_conflicts=True)
 
 
 class Migration(migrations.Migration):
@@ -928,6 +928,31 @@ class Repository(models.Model):
         )
         return entry
 
+    def add_source_packages(self, packages, **kwargs):
+        """
+        The method adds several :class:`SourcePackage` to the repository
+        using a single bulk insertion.
+
+        :param packages: The source packages to add to the repository
+        :type packages: iterable of :class:`SourcePackage`
+
+        The parameters needed for the corresponding
+        :class:`SourcePackageRepositoryEntry` should be in the keyword
+        arguments, they are used for all the created entries.
+
+        Returns the list of newly created :class:`SourcePackageRepositoryEntry`.
+
+        :rtype: list of :class:`SourcePackageRepositoryEntry`
+        """
+        return SourcePackageRepositoryEntry.objects.bulk_create([
+            SourcePackageRepositoryEntry(
+                repository=self,
+                source_package=package,
+                **kwargs,
+            )
+            for package in packages
+        ], batch_size=500)
+
     def has_source_package_name(self, source_package_name):
         """
         Checks whether this :class:`Repository` contains a source package with
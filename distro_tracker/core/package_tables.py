@@ -13,8 +13,10 @@ import logging
 
 from django.conf import settings
 from django.db.models import Prefetch
+from django.db.models.fields.json import KeyTextTransform
 from django.template import Context, Template
 from django.template.loader import get_template
+from django.utils.functional import cached_property
 
 from distro_tracker import vendor
 from distro_tracker.core.models import (
@@ -49,20 +51,21 @@ class BaseTableField(metaclass=PluginRegistry):
         """
         return {}
 
-    @property
-    def column_name():
-        """
-        The column name for the field
-        """
-        return ''
+    #: The column name for the field
+    column_name = ''
 
-    @property
-    def template_name(self):
-        """
-        If the field has a corresponding template which is used to render its
-        HTML output, this property should contain the name of this template.
-        """
-        return None
+    #: If the field has a corresponding template which is used to render its
+    #: HTML output, this attribute should contain the name of this template.
+    template_name = None
+
+    #: A list of lookups to be prefetched along with Table's QuerySet of
+    #: packages. Elements may be either a String or Prefetch object
+    prefetch_related_lookups = []
+
+    #: A list of single-valued relations (foreign keys and one-to-one
+    #: relations) to be joined in the Table's QuerySet of packages. Those
+    #: do not need any additional query, unlike prefetched lookups.
+    select_related_lookups = []
 
     def render(self, package, context=None, request=None):
         """
@@ -74,15 +77,6 @@ class BaseTableField(metaclass=PluginRegistry):
             context = {self.slug: self.context(package)}
         return self._template.render(context, request)
 
-    @property
-    def prefetch_related_lookups():
-        """
-        Returns a list of lookups to be prefetched along with
-        Table's QuerySet of packages. Elements may be either a String
-        or Prefetch object
-        """
-        return []
-
 
 class GeneralInformationTableField(BaseTableField):
     """
@@ -228,9 +222,13 @@ class ArchiveTableField(BaseTableField):
             queryset=PackageData.objects.filter(key='general'),
             to_attr='general_data'
         ),
+        # Only the default pool URL is displayed, don't load the whole
+        # (potentially long) list of versions
         Prefetch(
             'data',
-            queryset=PackageData.objects.filter(key='versions'),
+            queryset=PackageData.objects.filter(key='versions').annotate(
+                default_pool_url=KeyTextTransform('default_pool_url', 'value')
+            ).defer('value'),
             to_attr='versions'
         )
     ]
@@ -247,8 +245,7 @@ class ArchiveTableField(BaseTableField):
             general['version'] = info.value['version']
 
         try:
-            info = package.versions[0].value
-            general['default_pool_url'] = info['default_pool_url']
+            general['default_pool_url'] = package.versions[0].default_pool_url
         except IndexError:
             # There is no versions info for the package
             general['default_pool_url'] = '#'
@@ -280,7 +277,7 @@ class BugStatsTableField(BaseTableField, BugDisplayManagerMixin):
     """
     column_name = 'Bugs'
     slug = 'bugs'
-    prefetch_related_lookups = ['bug_stats']
+    select_related_lookups = ['bug_stats']
 
     @property
     def template_name(self):
@@ -312,6 +309,11 @@ class BasePackageTable(metaclass=PluginRegistry):
     #: Must be overriden and set to a unique non-empty value.
     slug = None
 
+    #: The maximum number of packages (along with their prefetched lookups)
+    #: loaded in memory at once when building the rows of a table without
+    #: limit.
+    rows_chunk_size = 200
+
     def __init__(self, scope, title=None, limit=None, tag=None):
         """
         :param scope: a convenient object that can be used to define the list
@@ -383,6 +385,9 @@ class BasePackageTable(metaclass=PluginRegistry):
         attributes_name = set()
         package_query_set = self.packages
         for field in self.table_fields:
+            if field.select_related_lookups:
+                package_query_set = package_query_set.select_related(
+                    *field.select_related_lookups)
             for lookup in field.prefetch_related_lookups:
                 if isinstance(lookup, Prefetch):
                     if lookup.to_attr in attributes_name:
@@ -431,11 +436,13 @@ class BasePackageTable(metaclass=PluginRegistry):
             BugStatsTableField,
         ]
 
-    @property
+    @cached_property
     def table_fields(self):
         """
         Returns the tuple of :class:`BaseTableField` that will compose the
         table
+
+        The vendor is only queried once per table instance.
         """
         fields, implemented = vendor.call('get_table_fields', **{
             'table': self,
@@ -455,6 +462,8 @@ class BasePackageTable(metaclass=PluginRegistry):
         packages = self.packages_with_prefetch_related
         if self.limit:
             packages = packages[:self.limit]
+        else:
+            packages = self._iter_packages_in_chunks(packages)
 
         template = self.get_row_template()
         fields = [f() for f in self.table_fields]
@@ -468,6 +477,24 @@ class BasePackageTable(metaclass=PluginRegistry):
 
         return rows
 
+    def _iter_packages_in_chunks(self, packages):
+        """
+        Iterates over the packages by fetching at most
+        :attr:`rows_chunk_size` of them at a time.
+
+        Unlike :meth:`QuerySet.iterator()
+        <django.db.models.query.QuerySet.iterator>`, slicing the
+        queryset keeps its prefetched lookups with all supported Django
+        versions.
+        """
+        start = 0
+        while True:
+            chunk = list(packages[start:start + self.rows_chunk_size])
+            yield from chunk
+            if len(chunk) < self.rows_chunk_size:
+                return
+            start += self.rows_chunk_size
+
     @property
     def number_of_packages(self):
         """
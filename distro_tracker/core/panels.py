@@ -177,6 +177,8 @@ class GeneralInformationPanel(BasePanel):
       <distro_tracker.vendor.skeleton.rules.get_maintainer_extra>`
     - :func:`get_uploader_extra
       <distro_tracker.vendor.skeleton.rules.get_uploader_extra>`
+    - :func:`get_uploader_extras
+      <distro_tracker.vendor.skeleton.rules.get_uploader_extras>`
     """
     position = 'left'
     title = 'general'
@@ -0,0 +1,81 @@
+# Copyright 2013 The Distro Tracker Developers
+# See the COPYRIGHT file at the top-level directory of this distribution and
+# at https://deb.li/DTAuthors
+#
+# This file is part of Distro Tracker. It is subject to the license terms
+# in the LICENSE file found in the top-level directory of this
+# distribution and at https://deb.li/DTLicense. No part of Distro Tracker,
+# including this file, may be copied, modified, propagated, or distributed
+# except according to the terms contained in the LICENSE file.
+"""The URL routes included below ``teams/``."""
+
+from django.urls import path
+from django.views.generic import TemplateView
+
+from distro_tracker.core.views import (
+    AddPackageToTeamView,
+    AddTeamMember,
+    ConfirmMembershipView,
+    CreateTeamView,
+    DeleteTeamView,
+    EditMembershipView,
+    JoinTeamView,
+    LeaveTeamView,
+    ManageTeam,
+    RemovePackageFromTeamView,
+    RemoveTeamMember,
+    SetMembershipKeywords,
+    SetMuteTeamView,
+    TeamDetailsView,
+    TeamListView,
+    TeamPackagesTableView,
+    UpdateTeamView
+)
+
+urlpatterns = [
+    path('+create/', CreateTeamView.as_view(),
+         name='dtracker-teams-create'),
+    path('<slug:slug>/+delete/', DeleteTeamView.as_view(),
+         name='dtracker-team-delete'),
+    path('+delete-success/',
+         TemplateView.as_view(template_name='core/team-deleted.html'),
+         name='dtracker-team-deleted'),
+    path('<slug:slug>/+update/', UpdateTeamView.as_view(),
+         name='dtracker-team-update'),
+    path('<slug:slug>/+add-package/', AddPackageToTeamView.as_view(),
+         name='dtracker-team-add-package'),
+    path('<slug:slug>/+remove-package/',
+         RemovePackageFromTeamView.as_view(),
+         name='dtracker-team-remove-package'),
+    path('<slug:slug>/+join/', JoinTeamView.as_view(),
+         name='dtracker-team-join'),
+    path('<slug:slug>/+leave/', LeaveTeamView.as_view(),
+         name='dtracker-team-leave'),
+    path('<slug:slug>/+add-member/', AddTeamMember.as_view(),
+         name='dtracker-team-add-member'),
+    path('<slug:slug>/+remove-member/', RemoveTeamMember.as_view(),
+         name='dtracker-team-remove-member'),
+    path('<slug:slug>/+manage/', ManageTeam.as_view(),
+         name='dtracker-team-manage'),
+    path('', TeamListView.as_view(),
+         name='dtracker-team-list'),
+    path('+confirm/<path:confirmation_key>/',
+         ConfirmMembershipView.as_view(),
+         name='dtracker-team-confirm-membership'),
+    path('<slug:slug>/+mute/', SetMuteTeamView.as_view(action='mute'),
+         name='dtracker-team-mute'),
+    path('<slug:slug>/+unmute/',
+         SetMuteTeamView.as_view(action='unmute'),
+         name='dtracker-team-unmute'),
+    path('<slug:slug>/+set-keywords/',
+         SetMembershipKeywords.as_view(),
+         name='dtracker-team-set-keywords'),
+    path('<slug:slug>/+manage-membership/',
+         EditMembershipView.as_view(),
+         name='dtracker-team-manage-membership'),
+    path('<slug:slug>/+table/<slug:table_slug>/',
+         TeamPackagesTableView.as_view(),
+         name='dtracker-team-general-table'),
+    path('<slug:slug>/', TeamDetailsView.as_view(),
+         name='dtracker-team-page'),
+]
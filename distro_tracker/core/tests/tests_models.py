@@ -668,6 +668,25 @@ class RepositoryTests(TestCase):
         # Correct repository
         self.assertEqual(e.repository, self.repository)
 
+    def test_add_source_entries_to_repository(self):
+        """
+        Tests adding several source package entries to a repository instance
+        at once.
+        """
+        source_package = SourcePackage.objects.create(
+            source_package_name=self.src_pkg_name, version='1.2.0')
+
+        self.repository.add_source_packages(
+            [self.source_package, source_package], component=self.component)
+
+        # An entry is created for each source package
+        self.assertEqual(SourcePackageRepositoryEntry.objects.count(), 2)
+        for entry in SourcePackageRepositoryEntry.objects.all():
+            self.assertIn(
+                entry.source_package, [self.source_package, source_package])
+            self.assertEqual(entry.repository, self.repository)
+            self.assertEqual(entry.component, self.component)
+
     def test_add_binary_entry_to_repository(self):
         """
         Tests adding a new binary package entry (name, version) to a repository
@@ -358,6 +358,18 @@ class NewsFeedTests(TestCase):
             self.get_package_news_feed_url(self.package.name),
             status_code=301)
 
+    def test_legacy_redirect_with_mismatched_hash(self):
+        legacy_url = '/q/{pkg}/news.rss20.xml'.format(pkg=self.package.name)
+
+        response = self.client.get(legacy_url)
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_legacy_redirect_with_hash_equal_to_name(self):
+        response = self.client.get('/d/d/news.rss20.xml')
+
+        self.assertEqual(response.status_code, 404)
+
     def test_package_page_contains_news_feed_url(self):
         rss_url = self.get_package_news_feed_url(self.package.name)
         News.objects.create(
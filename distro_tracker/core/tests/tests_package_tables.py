@@ -17,6 +17,8 @@ from unittest.mock import mock_open, patch
 
 from bs4 import BeautifulSoup as soup
 
+from django.db.models import Prefetch
+from django.db.models.fields.json import KeyTextTransform
 from django.template import Context
 
 from distro_tracker.core.models import (
@@ -51,34 +53,58 @@ def create_source_package_with_data(name):
     return package
 
 
+def create_source_packages_with_data(*names):
+    """
+    Create several source packages with some associated data using a
+    fixed number of queries.
+    """
+    SourcePackageName.objects.bulk_create([
+        SourcePackageName(name=name, source=True) for name in names
+    ])
+    # Primary keys are not set by bulk_create() on all database backends
+    packages = SourcePackageName.objects.in_bulk(names, field_name='name')
+    PackageData.objects.bulk_create([
+        data
+        for package in packages.values()
+        for data in build_package_data(package)
+    ])
+    return [packages[name] for name in names]
+
+
+def build_package_data(package):
+    """Build some fake general PackageData for a given package."""
+    return [
+        PackageData(
+            package=package,
+            key='general',
+            value={
+                'name': package.name,
+                'maintainer': {
+                    'email': 'jane@example.com',
+                },
+                'vcs': {
+                    'type': 'git',
+                    'url': 'https://salsa.debian.org/qa/distro-tracker.git',
+                    'browser': 'https://salsa.debian.org/qa/distro-tracker',
+                },
+                'component': 'main',
+                'version': '2.0.5-1',
+            }
+        ),
+        PackageData(
+            package=package,
+            key='versions',
+            value={
+                'version_list': [],
+                'default_pool_url': 'https://deb.debian.org/debian/pool/main/'
+            }
+        ),
+    ]
+
+
 def create_package_data(package):
     """Create some fake general PackageData for a given package."""
-    PackageData.objects.create(
-        package=package,
-        key='general',
-        value={
-            'name': package.name,
-            'maintainer': {
-                'email': 'jane@example.com',
-            },
-            'vcs': {
-                'type': 'git',
-                'url': 'https://salsa.debian.org/qa/distro-tracker.git',
-                'browser': 'https://salsa.debian.org/qa/distro-tracker',
-            },
-            'component': 'main',
-            'version': '2.0.5-1',
-        }
-    )
-
-    PackageData.objects.create(
-        package=package,
-        key='versions',
-        value={
-            'version_list': [],
-            'default_pool_url': 'https://deb.debian.org/debian/pool/main/'
-        }
-    )
+    PackageData.objects.bulk_create(build_package_data(package))
 
 
 def create_package_bug_stats(package):
@@ -92,8 +118,11 @@ def create_package_bug_stats(package):
 
 
 class GeneralInformationTableFieldTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.package = create_source_package_with_data('dummy-package')
+
     def setUp(self):
-        self.package = create_source_package_with_data('dummy-package')
         self.package.general_data = self.package.data.filter(key='general')
         self.package.binaries_data = self.package.data.filter(key='binaries')
         self.field = GeneralInformationTableField()
@@ -123,8 +152,11 @@ class GeneralInformationTableFieldTests(TestCase):
 
 
 class VcsTableFieldTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.package = create_source_package_with_data('dummy-package')
+
     def setUp(self):
-        self.package = create_source_package_with_data('dummy-package')
         self.package.general_data = self.package.data.filter(key='general')
         self.field = VcsTableField()
 
@@ -151,12 +183,16 @@ class VcsTableFieldTests(TestCase):
 
 
 class ArchiveTableFieldTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.package = create_source_package_with_data('dummy-package')
+
     def setUp(self):
-        self.package = create_source_package_with_data('dummy-package')
         self.package.general_data = self.package.data.filter(
             key='general')
         self.package.versions = self.package.data.filter(
-            key='versions')
+            key='versions').annotate(
+                default_pool_url=KeyTextTransform('default_pool_url', 'value'))
         self.field = ArchiveTableField()
 
     def test_field_context(self):
@@ -179,9 +215,12 @@ class ArchiveTableFieldTests(TestCase):
 
 
 class BugStatsTableFieldTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.package = create_source_package_with_data('dummy-package')
+        create_package_bug_stats(cls.package)
+
     def setUp(self):
-        self.package = create_source_package_with_data('dummy-package')
-        create_package_bug_stats(self.package)
         self.field = BugStatsTableField()
 
     def test_field_context(self):
@@ -204,7 +243,8 @@ class BugStatsTableFieldTests(TestCase):
         self.assertEqual(
             self.field.template_name,
             'core/package-table-fields/bugs.html')
-        self.assertEqual(len(self.field.prefetch_related_lookups), 1)
+        self.assertEqual(len(self.field.prefetch_related_lookups), 0)
+        self.assertEqual(len(self.field.select_related_lookups), 1)
 
 
 class BasePackageTableTests(TestCase):
@@ -231,15 +271,18 @@ class BasePackageTableTests(TestCase):
 
 
 class GeneralTeamPackageTableTests(TestCase, TemplateTestsMixin):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            main_email='paul@example.com', password='pw4paul')
+        cls.team = Team.objects.create_with_slug(
+            owner=cls.user, name="Team name", public=True)
+        cls.package = create_source_package_with_data('dummy-package-1')
+        create_package_bug_stats(cls.package)
+        cls.team.packages.add(cls.package)
+
     def setUp(self):
         self.tested_instance = GeneralTeamPackageTable(None)
-        self.user = User.objects.create_user(
-            main_email='paul@example.com', password='pw4paul')
-        self.team = Team.objects.create_with_slug(
-            owner=self.user, name="Team name", public=True)
-        self.package = create_source_package_with_data('dummy-package-1')
-        create_package_bug_stats(self.package)
-        self.team.packages.add(self.package)
 
     def get_team_page_response(self):
         return self.client.get(self.team.get_absolute_url())
@@ -248,9 +291,14 @@ class GeneralTeamPackageTableTests(TestCase, TemplateTestsMixin):
         """
         Checks whether the general package table is found in
         the rendered HTML response.
+
+        The parsed HTML is stored on the response so that looking up
+        several tables in the same page only parses it once.
         """
-        html = soup(response.content, 'html.parser')
-        tables = html.findAll("div", {'class': 'package-table'})
+        if not hasattr(response, 'parsed_html'):
+            response.parsed_html = soup(response.content, 'html.parser')
+        tables = response.parsed_html.findAll(
+            "div", {'class': 'package-table'})
         for table in tables:
             if title in str(table):
                 return table
@@ -294,12 +342,19 @@ class GeneralTeamPackageTableTests(TestCase, TemplateTestsMixin):
 
         rows = table.tbody.findAll('tr')
         self.assertEqual(len(rows), self.team.packages.count())
-        ordered_packages = self.team.packages.order_by(
-            'name').prefetch_related('data', 'bug_stats')
+        ordered_packages = list(
+            self.team.packages.order_by('name').prefetch_related(
+                Prefetch(
+                    'data',
+                    queryset=PackageData.objects.filter(key='general'),
+                    to_attr='general_data'
+                )
+            )
+        )
 
         for index, row in enumerate(rows):
             self.assertIn(ordered_packages[index].name, str(row))
-            general = ordered_packages[index].data.get(key='general').value
+            general = ordered_packages[index].general_data[0].value
             self.assertIn(general['vcs']['browser'], str(row))
             self.assertIn('bugs-field', str(row))
 
@@ -319,12 +374,12 @@ class GeneralTeamPackageTableTests(TestCase, TemplateTestsMixin):
         queries regardless of the number of packages
         """
         table = GeneralTeamPackageTable(self.team)
-        self.assert_number_of_queries(table, 5)
+        self.assert_number_of_queries(table, 4)
 
         new_package = create_source_package_with_data('another-dummy-package')
         create_package_bug_stats(new_package)
         self.team.packages.add(new_package)
-        self.assert_number_of_queries(table, 5)
+        self.assert_number_of_queries(table, 4)
 
     def test_table_limit_of_packages(self):
         """
@@ -349,6 +404,22 @@ class GeneralTeamPackageTableTests(TestCase, TemplateTestsMixin):
         table_field = table.rows[1]
         self.assertIn(new_package.name, table_field)
 
+    def test_table_rows_fetched_in_chunks(self):
+        """
+        Tests that all the rows are built, in order, when the packages
+        are fetched in several chunks
+        """
+        self.team.packages.add(*create_source_packages_with_data(
+            'dummy-package-2', 'dummy-package-3'))
+        table = GeneralTeamPackageTable(self.team)
+        table.rows_chunk_size = 2
+
+        rows = table.rows
+
+        self.assertEqual(len(rows), 3)
+        for index, row in enumerate(rows, start=1):
+            self.assertIn('dummy-package-{}'.format(index), row)
+
     def test_table_with_tag(self):
         """
         Tests table with tag
@@ -403,10 +474,8 @@ class CreateTableFunctionTests(TestCase):
             main_email='paul@example.com', password='pw4paul')
         self.team = Team.objects.create_with_slug(
             owner=self.user, name="Team name", public=True)
-        self.team.packages.add(
-            create_source_package_with_data('dummy-package-1'))
-        self.team.packages.add(
-            create_source_package_with_data('dummy-package-2'))
+        self.team.packages.add(*create_source_packages_with_data(
+            'dummy-package-1', 'dummy-package-2'))
 
     def test_create_table_with_valid_params(self):
         """
@@ -18,6 +18,8 @@ import sys
 from unittest import mock
 
 from django.conf import settings
+from django.db import transaction
+from django.template.defaultfilters import slugify
 from django.test.utils import override_settings
 
 from distro_tracker.accounts.models import User, UserEmail
@@ -46,7 +48,23 @@ from distro_tracker.core.retrieve_data import (
     UpdateVersionInformation,
     retrieve_repository_info
 )
-from distro_tracker.test import TestCase
+from distro_tracker.test import SimpleTestCase, TestCase
+
+TESTS_DATA_DIR = os.path.join(os.path.dirname(__file__), 'tests-data')
+
+RELEASE_ARCHITECTURES = (
+    'amd64 armel armhf i386 ia64 kfreebsd-amd64 '
+    'kfreebsd-i386 mips mipsel powerpc s390 s390x sparc'.split()
+)
+RELEASE_COMPONENTS = ['main', 'contrib', 'non-free']
+RELEASE_FILE_CONTENT = (
+    'Suite: stable\n'
+    'Codename: wheezy\n'
+    'Architectures: ' + ' '.join(RELEASE_ARCHITECTURES) + '\n'
+    'Components: ' + ' '.join(RELEASE_COMPONENTS) + '\n'
+    'Version: 7.1\n'
+    'Description: Debian 7.1 Released 15 June 2013\n'
+).encode('utf-8')
 
 
 @override_settings(
@@ -58,16 +76,13 @@ class RetrievePseudoPackagesTest(TestCase):
     def setUp(self):
         # Since the tests module is used to provide the vendor rules,
         # we dynamically add the needed function
+        # and the patcher removes it again after the tests
         self.packages = ['package1', 'package2']
-        self.mock_get_pseudo_package_list = mock.create_autospec(
-            lambda: None, return_value=self.packages)
-        sys.modules[__name__].get_pseudo_package_list = (
-            self.mock_get_pseudo_package_list
-        )
-
-    def tearDown(self):
-        # The added function is removed after the tests
-        delattr(sys.modules[__name__], 'get_pseudo_package_list')
+        patcher = mock.patch.object(
+            sys.modules[__name__], 'get_pseudo_package_list', create=True,
+            return_value=self.packages)
+        self.mock_get_pseudo_package_list = patcher.start()
+        self.addCleanup(patcher.stop)
 
     def update_pseudo_package_list(self):
         """
@@ -82,8 +97,10 @@ class RetrievePseudoPackagesTest(TestCase):
         """
         Helper method adds the given packages to the database.
         """
-        for package in packages:
-            PseudoPackageName.objects.create(name=package)
+        PseudoPackageName.objects.bulk_create([
+            PseudoPackageName(name=package, pseudo=True)
+            for package in packages
+        ], ignore_conflicts=True)
 
     def test_all_pseudo_packages_added(self):
         """
@@ -94,7 +111,8 @@ class RetrievePseudoPackagesTest(TestCase):
 
         self.assertSequenceEqual(
             sorted(self.packages),
-            sorted([pkg.name for pkg in PseudoPackageName.objects.all()])
+            list(PseudoPackageName.objects.order_by('name').values_list(
+                'name', flat=True))
         )
 
     def test_pseudo_package_exists(self):
@@ -108,7 +126,8 @@ class RetrievePseudoPackagesTest(TestCase):
 
         self.assertSequenceEqual(
             sorted(self.packages),
-            sorted([pkg.name for pkg in PseudoPackageName.objects.all()])
+            list(PseudoPackageName.objects.order_by('name').values_list(
+                'name', flat=True))
         )
 
     def test_pseudo_package_update(self):
@@ -123,7 +142,8 @@ class RetrievePseudoPackagesTest(TestCase):
 
         self.assertSequenceEqual(
             sorted(self.packages),
-            sorted([pkg.name for pkg in PseudoPackageName.objects.all()])
+            list(PseudoPackageName.objects.order_by('name').values_list(
+                'name', flat=True))
         )
 
     def test_pseudo_package_update_remove(self):
@@ -141,16 +161,15 @@ class RetrievePseudoPackagesTest(TestCase):
         # package
         self.assertSequenceEqual(
             sorted(self.packages),
-            sorted([pkg.name for pkg in PseudoPackageName.objects.all()])
+            list(PseudoPackageName.objects.order_by('name').values_list(
+                'name', flat=True))
         )
         # Old pseudo packages are now demoted to subscription-only packages
         self.assertSequenceEqual(
             sorted(old_packages),
-            sorted([
-                pkg.name
-                for pkg in PackageName.objects.filter(
-                    pseudo=False, binary=False, source=False).all()
-            ])
+            list(PackageName.objects.filter(
+                pseudo=False, binary=False, source=False
+            ).order_by('name').values_list('name', flat=True))
         )
 
     def test_no_changes_when_resource_unavailable(self):
@@ -167,7 +186,8 @@ class RetrievePseudoPackagesTest(TestCase):
 
         self.assertSequenceEqual(
             sorted(self.packages),
-            sorted([pkg.name for pkg in PseudoPackageName.objects.all()])
+            list(PseudoPackageName.objects.order_by('name').values_list(
+                'name', flat=True))
         )
 
     def test_subscriptions_remain_after_update(self):
@@ -230,7 +250,7 @@ class RetrievePseudoPackagesTest(TestCase):
         mock_update_pseudo_package_list.assert_called_with()
 
 
-class RetrieveRepositoryInfoTests(TestCase):
+class RetrieveRepositoryInfoTests(SimpleTestCase):
     def test_sources_list_entry_validation(self):
         from distro_tracker.core.admin import validate_sources_list_entry
         from django.core.exceptions import ValidationError
@@ -256,29 +276,16 @@ class RetrieveRepositoryInfoTests(TestCase):
         Tests that the function returns correct data when it is all found in
         the Release file.
         """
-        architectures = (
-            'amd64 armel armhf i386 ia64 kfreebsd-amd64 '
-            'kfreebsd-i386 mips mipsel powerpc s390 s390x sparc'.split()
-        )
-        components = ['main', 'contrib', 'non-free']
-        mock_response_text = (
-            'Suite: stable\n'
-            'Codename: wheezy\n'
-            'Architectures: ' + ' '.join(architectures) + '\n'
-            'Components: ' + ' '.join(components) + '\n'
-            'Version: 7.1\n'
-            'Description: Debian 7.1 Released 15 June 2013\n'
-        )
         self.mock_http_request()
-        self.set_http_response(body=mock_response_text)
+        self.set_http_response(body=RELEASE_FILE_CONTENT)
 
         repository_info = retrieve_repository_info(
             'deb http://repository.com/ stable')
 
         expected_info = {
             'uri': 'http://repository.com/',
-            'architectures': architectures,
-            'components': components,
+            'architectures': RELEASE_ARCHITECTURES,
+            'components': RELEASE_COMPONENTS,
             'binary': True,
             'source': False,
             'codename': 'wheezy',
@@ -331,18 +338,41 @@ class RetrieveRepositoryInfoTests(TestCase):
 class RetrieveSourcesInformationTest(TestCase):
     fixtures = ['repository-test-fixture.json']
 
+    #: Maintainer and architectures of the source packages created by tests
+    maintainer = {
+        'name': 'Maintainer',
+        'email': 'maintainer@domain.com',
+    }
+    architectures = ('amd64', 'all')
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Patch the APT cache update once for the whole class, the mock is
+        # reset before each test
+        patcher = mock.patch(
+            'distro_tracker.core.retrieve_data.AptCache.update_repositories')
+        cls.mock_update_repositories = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.repository = Repository.objects.first()
+        cls.component = 'main'
+
     def setUp(self):
-        self.repository = Repository.objects.all()[0]
-        self.component = 'main'
+        self.mock_update_repositories.reset_mock(
+            return_value=True, side_effect=True)
 
     def get_path_to(self, file_name):
-        return os.path.join(os.path.dirname(__file__), 'tests-data', file_name)
+        return os.path.join(TESTS_DATA_DIR, file_name)
 
     def run_update(self, **kwargs):
         task = UpdateRepositoriesTask(**kwargs)
         task.execute()
 
-    def set_mock_sources(self, mock_update, file_name):
+    def set_mock_sources(self, file_name):
+        mock_update = self.mock_update_repositories
         old_return = mock_update.return_value
         if not isinstance(old_return, tuple):
             old_return = ([], [])
@@ -352,7 +382,8 @@ class RetrieveSourcesInformationTest(TestCase):
             (self.repository, self.component, self.get_path_to(file_name))
         ], packages)
 
-    def set_mock_packages(self, mock_update, file_name):
+    def set_mock_packages(self, file_name):
+        mock_update = self.mock_update_repositories
         old_return = mock_update.return_value
         if not isinstance(old_return, tuple):
             old_return = ([], [])
@@ -363,37 +394,56 @@ class RetrieveSourcesInformationTest(TestCase):
         ]
 
     def assert_package_by_name_in(self, pkg_name, qs):
-        self.assertIn(pkg_name, [pkg.name for pkg in qs])
+        self.assertIn(pkg_name, qs.values_list('name', flat=True))
 
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_update_repositories_creates_source(self, mock_update_repositories):
+    def get_binary_entry(self):
+        """
+        Returns the single binary entry of the repository along with its
+        binary package, binary package name and source package name.
+        """
+        return self.repository.binary_entries.select_related(
+            'binary_package__binary_package_name',
+            'binary_package__source_package__source_package_name',
+        ).get()
+
+    def test_update_repositories_creates_source(self):
         """
         Tests that a new source package is created when a sources file is
         updated.
         """
-        self.set_mock_sources(mock_update_repositories, 'Sources')
+        self.set_mock_sources('Sources')
 
         self.run_update()
 
         self.assertEqual(SourcePackageName.objects.count(), 1)
-        self.assertIn(
+        self.assert_package_by_name_in(
             'chromium-browser',
-            [pkg.name for pkg in SourcePackageName.objects.all()]
+            SourcePackageName.objects.all()
         )
         srcpkg = SourcePackage.objects.first()
         self.assertEqual(srcpkg.dsc_file_name,
                          'chromium-browser_27.0.1453.110-1~deb7u1.dsc')
         self.assertEqual(BinaryPackageName.objects.count(), 8)
 
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_update_repositories_adds_component(self, mock_update_repositories):
+    def test_update_repositories_query_count(self):
+        """
+        Tests the number of queries issued when updating the repositories.
+        """
+        self.set_mock_sources('Sources')
+
+        with self.assertNumQueries(117):
+            self.run_update()
+
+        # Running it again without any change only checks the existing data
+        with self.assertNumQueries(25):
+            self.run_update()
+
+    def test_update_repositories_adds_component(self):
         """
         Tests that the new package created sets the component field in
         PackageData
         """
-        self.set_mock_sources(mock_update_repositories, 'Sources')
+        self.set_mock_sources('Sources')
 
         self.assertEqual(PackageData.objects.count(), 0)
         self.run_update()
@@ -405,16 +455,12 @@ class RetrieveSourcesInformationTest(TestCase):
         self.assertEqual(
             package_data.value['component'], self.component)
 
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_update_repositories_without_files_field(self,
-                                                     mock_update_repositories):
+    def test_update_repositories_without_files_field(self):
         """
         Tests that a new source package is created when a sources file is
         updated.
         """
-        self.set_mock_sources(mock_update_repositories,
-                              'Sources-without-Files-field')
+        self.set_mock_sources('Sources-without-Files-field')
 
         self.run_update()
 
@@ -423,9 +469,7 @@ class RetrieveSourcesInformationTest(TestCase):
         self.assertEqual(srcpkg.dsc_file_name,
                          'chromium-browser_27.0.1453.110-1~deb7u1.dsc')
 
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_update_repositories_existing(self, mock_update_repositories):
+    def test_update_repositories_existing(self):
         """
         Tests that when an existing source repository is changed in the newly
         retrieved data, it is updated in the database.
@@ -434,7 +478,7 @@ class RetrieveSourcesInformationTest(TestCase):
         SourcePackageName.objects.create(name='chromium-browser')
         # Sanity check - there were no binary packages
         self.assertEqual(BinaryPackageName.objects.count(), 0)
-        self.set_mock_sources(mock_update_repositories, 'Sources')
+        self.set_mock_sources('Sources')
 
         self.run_update()
 
@@ -446,14 +490,12 @@ class RetrieveSourcesInformationTest(TestCase):
         )
         self.assertEqual(BinaryPackageName.objects.count(), 8)
 
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_update_repositories_no_changes(self, mock_update_repositories):
+    def test_update_repositories_no_changes(self):
         """
         Tests that when an update is ran multiple times with no changes to the
         data, nothing changes in the database either.
         """
-        self.set_mock_sources(mock_update_repositories, 'Sources')
+        self.set_mock_sources('Sources')
         self.run_update()
 
         # Run it again.
@@ -461,14 +503,12 @@ class RetrieveSourcesInformationTest(TestCase):
 
         self.assertEqual(SourcePackageName.objects.count(), 1)
 
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_update_repositories_force_changes(self, mock_update_repositories):
+    def test_update_repositories_force_changes(self):
         """
         Tests that force_update=True will overwrite bad data even when
         the version did not change.
         """
-        self.set_mock_sources(mock_update_repositories, 'Sources')
+        self.set_mock_sources('Sources')
         self.run_update()
         src = SourcePackage.objects.first()
         src.architectures.clear()
@@ -476,46 +516,36 @@ class RetrieveSourcesInformationTest(TestCase):
 
         # Run it again.
         self.run_update(force_update=True)
-        src = SourcePackage.objects.first()
+        src = SourcePackage.objects.prefetch_related('architectures').first()
         self.assertNotEqual(len(src.architectures.all()), 0)
 
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_update_changed_binary_mapping_1(self, mock_update):
+    def test_update_changed_binary_mapping_1(self):
         """
         Tests the scenario when new data changes the source package to which
         a particular binary package belongs.
         """
-        self.set_mock_sources(mock_update, 'Sources-minimal-1')
+        self.set_mock_sources('Sources-minimal-1')
 
         src_pkg = self.create_source_package(
             name='dummy-package',
             version='0.1',
-            maintainer={
-                'name': 'Maintainer',
-                'email': 'maintainer@domain.com'
-            },
-            architectures=['amd64', 'all'],
+            maintainer=self.maintainer,
+            architectures=self.architectures,
         )
-        self.repository.add_source_package(src_pkg)
 
         src_pkg2 = self.create_source_package(
             name='src-pkg',
             binary_packages=['dummy-package-binary', 'other-package'],
             version='2.1',
-            maintainer={
-                'name': 'Maintainer',
-                'email': 'maintainer@domain.com'
-            },
-            architectures=['amd64', 'all'],
+            maintainer=self.maintainer,
+            architectures=self.architectures,
         )
-        self.repository.add_source_package(src_pkg2)
+        self.repository.add_source_packages([src_pkg, src_pkg2])
         # Sanity check: the binary package now exists
-        self.assertEqual(BinaryPackageName.objects.count(), 2)
-        self.assert_package_by_name_in(
-            'dummy-package-binary',
-            BinaryPackageName.objects.all()
-        )
+        binary_names = list(
+            BinaryPackageName.objects.values_list('name', flat=True))
+        self.assertEqual(len(binary_names), 2)
+        self.assertIn('dummy-package-binary', binary_names)
 
         self.run_update()
 
@@ -536,11 +566,10 @@ class RetrieveSourcesInformationTest(TestCase):
         )
         src_pkg = SourcePackageName.objects.get(name='dummy-package')
         # Both binary packages are still here
-        self.assertEqual(BinaryPackageName.objects.count(), 2)
-        self.assert_package_by_name_in(
-            'dummy-package-binary',
-            BinaryPackageName.objects.all()
-        )
+        binary_names = list(
+            BinaryPackageName.objects.values_list('name', flat=True))
+        self.assertEqual(len(binary_names), 2)
+        self.assertIn('dummy-package-binary', binary_names)
         # This binary package is now linked with a different source package
         bin_pkg = BinaryPackageName.objects.get(name='dummy-package-binary')
         self.assertEqual(
@@ -548,44 +577,34 @@ class RetrieveSourcesInformationTest(TestCase):
             src_pkg
         )
 
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_update_changed_binary_mapping_2(self, mock_update):
+    def test_update_changed_binary_mapping_2(self):
         """
         Tests the scenario when new data changes the source package to which
         a particular binary package belongs and the old source package is
         removed from the repository.
         """
-        self.set_mock_sources(mock_update, 'Sources-minimal')
+        self.set_mock_sources('Sources-minimal')
 
         src_pkg = self.create_source_package(
             name='dummy-package',
             version='0.1',
-            maintainer={
-                'name': 'Maintainer',
-                'email': 'maintainer@domain.com'
-            },
-            architectures=['amd64', 'all'],
+            maintainer=self.maintainer,
+            architectures=self.architectures,
         )
-        self.repository.add_source_package(src_pkg)
 
         src_pkg2 = self.create_source_package(
             name='src-pkg',
             binary_packages=['dummy-package-binary'],
             version='2.1',
-            maintainer={
-                'name': 'Maintainer',
-                'email': 'maintainer@domain.com'
-            },
-            architectures=['amd64', 'all'],
+            maintainer=self.maintainer,
+            architectures=self.architectures,
         )
-        self.repository.add_source_package(src_pkg2)
+        self.repository.add_source_packages([src_pkg, src_pkg2])
         # Sanity check: the binary package now exists
-        self.assertEqual(BinaryPackageName.objects.count(), 1)
-        self.assert_package_by_name_in(
-            'dummy-package-binary',
-            BinaryPackageName.objects.all()
-        )
+        binary_names = list(
+            BinaryPackageName.objects.values_list('name', flat=True))
+        self.assertEqual(len(binary_names), 1)
+        self.assertIn('dummy-package-binary', binary_names)
 
         self.run_update()
 
@@ -599,31 +618,25 @@ class RetrieveSourcesInformationTest(TestCase):
         )
         src_pkg = SourcePackageName.objects.get(name='dummy-package')
         # The binary package still exists
-        self.assertEqual(BinaryPackageName.objects.count(), 1)
-        self.assert_package_by_name_in(
-            'dummy-package-binary',
-            BinaryPackageName.objects.all()
-        )
+        binary_names = list(
+            BinaryPackageName.objects.values_list('name', flat=True))
+        self.assertEqual(len(binary_names), 1)
+        self.assertIn('dummy-package-binary', binary_names)
         # The binary package is now linked with a different source package
         bin_pkg = BinaryPackageName.objects.get(name='dummy-package-binary')
         self.assertEqual(bin_pkg.main_source_package_name, src_pkg)
 
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_update_removed_binary_package(self, mock_update):
+    def test_update_removed_binary_package(self):
         """
         Test the scenario when new data removes an existing binary package.
         """
-        self.set_mock_sources(mock_update, 'Sources-minimal')
+        self.set_mock_sources('Sources-minimal')
         src_pkg = self.create_source_package(
             name='dummy-package',
             binary_packages=['some-package'],
             version='0.1',
-            maintainer={
-                'name': 'Maintainer',
-                'email': 'maintainer@domain.com'
-            },
-            architectures=['amd64', 'all'],
+            maintainer=self.maintainer,
+            architectures=self.architectures,
         )
         self.repository.add_source_package(src_pkg)
         # Sanity check -- the binary package exists.
@@ -635,11 +648,10 @@ class RetrieveSourcesInformationTest(TestCase):
         self.run_update()
 
         # The binary package should no longer exist, replaced by a different one
-        self.assertEqual(BinaryPackageName.objects.count(), 1)
-        self.assert_package_by_name_in(
-            'dummy-package-binary',
-            BinaryPackageName.objects.all()
-        )
+        binary_names = list(
+            BinaryPackageName.objects.values_list('name', flat=True))
+        self.assertEqual(len(binary_names), 1)
+        self.assertIn('dummy-package-binary', binary_names)
         # The new binary package is now mapped to the existing source package
         bin_pkg = BinaryPackageName.objects.get(name='dummy-package-binary')
         self.assertEqual(
@@ -648,11 +660,7 @@ class RetrieveSourcesInformationTest(TestCase):
 
     @mock.patch('distro_tracker.core.retrieve_data.AptCache.'
                 'get_sources_files_for_repository')
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_update_multiple_sources_files(self,
-                                           mock_update_repositories,
-                                           mock_all_sources):
+    def test_update_multiple_sources_files(self, mock_all_sources):
         """
         Tests the update scenario where only one of the Sources files is
         updated. For example, only the main component of a repository is
@@ -662,16 +670,13 @@ class RetrieveSourcesInformationTest(TestCase):
             name='dummy-package',
             binary_packages=['dummy-package-binary'],
             version='1.0.0',
-            maintainer={
-                'name': 'Maintainer',
-                'email': 'maintainer@domain.com'
-            },
-            architectures=['amd64', 'all'],
+            maintainer=self.maintainer,
+            architectures=self.architectures,
             dsc_file_name='file.dsc'
         )
         self.repository.add_source_package(src_pkg)
         # Updated sources - only 1 file
-        self.set_mock_sources(mock_update_repositories, 'Sources')
+        self.set_mock_sources('Sources')
         # All sources - 2 files
         mock_all_sources.return_value = [
             self.get_path_to('Sources'),
@@ -704,11 +709,7 @@ class RetrieveSourcesInformationTest(TestCase):
 
     @mock.patch('distro_tracker.core.retrieve_data.AptCache.'
                 'get_sources_files_for_repository')
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_update_multiple_versions_in_source_file(self,
-                                                     mock_update_repositories,
-                                                     mock_all_sources):
+    def test_update_multiple_versions_in_source_file(self, mock_all_sources):
         """
         Tests the update scenario where a Sources file that was not updated
         contains multiple source versions of the same source package.
@@ -721,19 +722,15 @@ class RetrieveSourcesInformationTest(TestCase):
                 name=src_name,
                 binary_packages=['dummy-package-binary'],
                 version=version,
-                maintainer={
-                    'name': 'Maintainer',
-                    'email': 'maintainer@domain.com'
-                },
-                architectures=['amd64', 'all'],
+                maintainer=self.maintainer,
+                architectures=self.architectures,
                 dsc_file_name='file.dsc'
             )
             for version in versions
         ]
-        for src_pkg in src_pkgs:
-            self.repository.add_source_package(src_pkg)
+        self.repository.add_source_packages(src_pkgs)
         # Updated sources - only 1 file
-        self.set_mock_sources(mock_update_repositories, 'Sources')
+        self.set_mock_sources('Sources')
         # All sources - 2 files
         mock_all_sources.return_value = [
             self.get_path_to('Sources'),
@@ -752,123 +749,67 @@ class RetrieveSourcesInformationTest(TestCase):
         # Both versions are still in the repository
         entries = SourcePackageRepositoryEntry.objects.filter(
             repository=self.repository,
-            source_package__source_package_name__name='dummy-package')
-        self.assertEqual(2, entries.count())
+            source_package__source_package_name__name='dummy-package'
+        ).select_related('source_package')
+        self.assertEqual(2, len(entries))
         for entry in entries:
             self.assertIn(entry.source_package.version, versions)
 
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_binary_package_entry_created_1(self, mock_update_repositories):
+    def test_binary_package_entry_created(self):
         """
         Tests that a :class:`BinaryPackage
         <distro_tracker.core.models.BinaryPackage>` instance is added to a
         :class:`Repository <distro_tracker.core.models.Repository>` (a
         :class:`BinaryPackageRepositoryEntry
-        <distro_tracker.core.models.BinaryPackageRepositoryEntry>` is created)
+        <distro_tracker.core.models.BinaryPackageRepositoryEntry>` is created),
+        including when the name and the version of the binary package differ
+        from the ones of the source package.
         """
         package_name = 'chromium-browser'
-        self.set_mock_sources(mock_update_repositories, 'Sources')
-        self.set_mock_packages(mock_update_repositories, 'Packages')
-
-        self.run_update()
-
-        # The source package is still correctly created
-        self.assertEqual(SourcePackageName.objects.count(), 1)
-        source_package = SourcePackageName.objects.all()[0]
-        self.assertEqual(package_name, source_package.name)
-        # All binary names related to the source package are created
-        self.assertEqual(BinaryPackageName.objects.count(), 8)
-        # The binary package is found in the repository
-        self.assertEqual(1, self.repository.binary_entries.count())
-        entry = self.repository.binary_entries.all()[0]
-        self.assertEqual(
-            package_name,
-            entry.binary_package.binary_package_name.name)
-        # Associated with the correct source package?
-        self.assertEqual(
-            package_name,
-            entry.binary_package.source_package.name)
-
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_binary_package_entry_created_2(self, mock_update_repositories):
-        """
-        Tests that a :class:`BinaryPackage
-        <distro_tracker.core.models.BinaryPackage>` instance is added to a
-        :class:`Repository <distro_tracker.core.models.Repository>` (a
-        :class:`BinaryPackageRepositoryEntry
-        <distro_tracker.core.models.BinaryPackageRepositoryEntry>` is created)
-        when the name of the binary package is different than the name of the
-        source package.
-        """
-        package_name = 'chromium-browser'
-        binary_name = 'chromium-browser-dbg'
-        self.set_mock_sources(mock_update_repositories, 'Sources')
-        self.set_mock_packages(mock_update_repositories, 'Packages-1')
-
-        self.run_update()
-
-        # The source package is still correctly created
-        self.assertEqual(SourcePackageName.objects.count(), 1)
-        source_package = SourcePackageName.objects.all()[0]
-        self.assertEqual(package_name, source_package.name)
-        # All binary names related to the source package are created
-        self.assertEqual(BinaryPackageName.objects.count(), 8)
-        # The binary package is found in the repository
-        self.assertEqual(1, self.repository.binary_entries.count())
-        entry = self.repository.binary_entries.all()[0]
-        self.assertEqual(
-            binary_name,
-            entry.binary_package.binary_package_name.name)
-        # Associated with the correct source package?
-        self.assertEqual(
-            package_name,
-            entry.binary_package.source_package.name)
-
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_binary_package_entry_created_3(self, mock_update_repositories):
-        """
-        Tests that a :class:`BinaryPackage
-        <distro_tracker.core.models.BinaryPackage>` instance is added to a
-        :class:`Repository <distro_tracker.core.models.Repository>` (a
-        :class:`BinaryPackageRepositoryEntry
-        <distro_tracker.core.models.BinaryPackageRepositoryEntry>` is created)
-        when both the name and the version of the binary package differ to the
-        ones of the source package.
-        """
-        package_name = 'chromium-browser'
-        binary_name = 'chromium-browser-dbg'
-        binary_version = '27.0.1453.110-1~deb7u1+b1'
-        self.set_mock_sources(mock_update_repositories, 'Sources')
-        self.set_mock_packages(mock_update_repositories, 'Packages-2')
-
-        self.run_update()
-
-        # The source package is still correctly created
-        self.assertEqual(SourcePackageName.objects.count(), 1)
-        source_package = SourcePackageName.objects.all()[0]
-        self.assertEqual(package_name, source_package.name)
-        # All binary names related to the source package are created
-        self.assertEqual(BinaryPackageName.objects.count(), 8)
-        # The binary package is found in the repository
-        self.assertEqual(1, self.repository.binary_entries.count())
-        entry = self.repository.binary_entries.all()[0]
-        self.assertEqual(
-            binary_name,
-            entry.binary_package.binary_package_name.name)
-        # Associated with the correct source package?
-        self.assertEqual(
-            package_name,
-            entry.binary_package.source_package.name)
-        self.assertEqual(
-            binary_version,
-            entry.binary_package.version)
-
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_binary_package_entry_removed(self, mock_update_repositories):
+        cases = (
+            # (Packages file, binary name, binary version if checked)
+            ('Packages', package_name, None),
+            ('Packages-1', 'chromium-browser-dbg', None),
+            ('Packages-2', 'chromium-browser-dbg', '27.0.1453.110-1~deb7u1+b1'),
+        )
+        for packages_file, binary_name, binary_version in cases:
+            with self.subTest(packages_file=packages_file):
+                # Each case starts from the same database state
+                savepoint = transaction.savepoint()
+                try:
+                    self.set_mock_sources('Sources')
+                    self.set_mock_packages(packages_file)
+
+                    self.run_update()
+
+                    # The source package is still correctly created
+                    self.assertEqual(SourcePackageName.objects.count(), 1)
+                    source_package = SourcePackageName.objects.get()
+                    self.assertEqual(package_name, source_package.name)
+                    # All binary names related to the source package are
+                    # created
+                    self.assertEqual(BinaryPackageName.objects.count(), 8)
+                    # The binary package is found in the repository
+                    self.assertEqual(
+                        1, self.repository.binary_entries.count())
+                    # The entry and its related names come in one query
+                    with self.assertNumQueries(1):
+                        entry = self.get_binary_entry()
+                        self.assertEqual(
+                            binary_name,
+                            entry.binary_package.binary_package_name.name)
+                        # Associated with the correct source package?
+                        self.assertEqual(
+                            package_name,
+                            entry.binary_package.source_package.name)
+                    if binary_version:
+                        self.assertEqual(
+                            binary_version,
+                            entry.binary_package.version)
+                finally:
+                    transaction.savepoint_rollback(savepoint)
+
+    def test_binary_package_entry_removed(self):
         """
         Tests that an existing
         :class:`BinaryPackageRepositoryEntry
@@ -880,42 +821,38 @@ class RetrieveSourcesInformationTest(TestCase):
             name='dummy-package',
             binary_packages=[binary_name],
             version='1.0.0',
-            maintainer={
-                'name': 'Maintainer',
-                'email': 'maintainer@domain.com'
-            },
-            architectures=['amd64', 'all'],
+            maintainer=self.maintainer,
+            architectures=self.architectures,
             dsc_file_name='file.dsc'
         )
         # Add a binary package to the repository
-        bin_name = BinaryPackageName.objects.all()[0]
+        bin_name = BinaryPackageName.objects.get(name=binary_name)
         bin_pkg = BinaryPackage.objects.create(
             binary_package_name=bin_name,
             source_package=source_package,
             version='1.0.0')
-        arch = Architecture.objects.all()[0]
+        arch = Architecture.objects.get(name='amd64')
         self.repository.add_binary_package(bin_pkg, architecture=arch)
-        self.set_mock_sources(mock_update_repositories, 'Sources')
+        self.set_mock_sources('Sources')
         # The existing binary package is no longer found in this Packages file
-        self.set_mock_packages(mock_update_repositories, 'Packages-2')
+        self.set_mock_packages('Packages-2')
 
         self.run_update()
 
         # The entry is removed from the repository
         bin_pkgs_in_repo = [
             entry.binary_package.name
-            for entry in self.repository.binary_entries.all()
+            for entry in self.repository.binary_entries.select_related(
+                'binary_package__binary_package_name')
         ]
         self.assertNotIn(binary_name, bin_pkgs_in_repo)
 
-    @mock.patch(
-        'distro_tracker.core.retrieve_data.AptCache.update_repositories')
-    def test_update_repositories_invalid(self, mock_update_repositories):
+    def test_update_repositories_invalid(self):
         """
         Tests updating the repositories when the repository's Sources file is
         invalid.
         """
-        self.set_mock_sources(mock_update_repositories, 'Sources-invalid')
+        self.set_mock_sources('Sources-invalid')
 
         try:
             self.run_update()
@@ -1012,40 +949,42 @@ class UpdateTeamPackagesTaskTests(TestCase):
     Tests for the
     :class:`distro_tracker.core.retrieve_data.UpdateTeamPackagesTask` task.
     """
-    def setUp(self):
-        self.maintainer_email = 'maintainer@domain.com'
-        self.uploaders = [
+    @classmethod
+    def setUpTestData(cls):
+        cls.maintainer_email = 'maintainer@domain.com'
+        cls.uploaders = [
             'uploader1@domain.com',
             'uploader2@domain.com',
         ]
-        self.package = self.create_source_package(
+        cls.package = cls.create_source_package(
             name='dummy-package',
             version='1.0.0',
             maintainer={
                 'name': 'Maintainer',
-                'email': self.maintainer_email,
+                'email': cls.maintainer_email,
             },
-            uploaders=self.uploaders,
+            uploaders=cls.uploaders,
         )
-        self.repository = Repository.objects.create(
+        cls.repository = Repository.objects.create(
             name='repo', shorthand='repo', default=True)
-        self.non_default_repository = Repository.objects.create(
+        cls.non_default_repository = Repository.objects.create(
             name='nondef', shorthand='nondef')
 
-        self.password = 'asdf'
-        self.user = User.objects.create_user(
-            main_email='user@domain.com', password=self.password,
+        cls.password = 'asdf'
+        cls.user = User.objects.create_user(
+            main_email='user@domain.com', password=cls.password,
             first_name='', last_name='')
-        self.team = Team.objects.create_with_slug(
-            owner=self.user,
+        cls.team = Team.objects.create_with_slug(
+            owner=cls.user,
             name="Team",
-            maintainer_email=self.maintainer_email)
+            maintainer_email=cls.maintainer_email)
         # Create a team for each of the uploaders and maintainers
-        self.teams = [
-            Team.objects.create_with_slug(owner=self.user, name="Team" + str(i))
-            for i in range(5)
-        ]
+        Team.objects.bulk_create([
+            Team(owner=cls.user, name=name, slug=slugify(name))
+            for name in ("Team" + str(i) for i in range(5))
+        ])
 
+    def setUp(self):
         self.task = UpdateTeamPackagesTask()
 
     def run_task(self):
@@ -1060,7 +999,8 @@ class UpdateTeamPackagesTaskTests(TestCase):
         # Sanity check: the team does not have any packages
         self.assertEqual(0, self.team.packages.count())
 
-        self.run_task()
+        with self.assertNumQueries(25):
+            self.run_task()
 
         # The team is now associated with a new package
         self.assertEqual(1, self.team.packages.count())
@@ -1199,9 +1139,8 @@ class UpdateTeamPackagesTaskTests(TestCase):
             )
         ]
         # Add them all to the default repository
-        for source_package in \
-                team_maintainer_packages + unknown_maintainer_packages:
-            self.repository.add_source_package(source_package)
+        self.repository.add_source_packages(
+            team_maintainer_packages + unknown_maintainer_packages)
         # Sanity check: the maintainer's team does not have any packages
         self.assertEqual(0, self.team.packages.count())
 
@@ -1222,8 +1161,9 @@ class UpdatePackageGeneralInformationTest(TestCase):
     task.
     """
 
-    def setUp(self):
-        self.srcpkg = self.create_source_package(
+    @classmethod
+    def setUpTestData(cls):
+        cls.srcpkg = cls.create_source_package(
             name='dummy-package',
             version='1.0.0',
             maintainer={
@@ -1238,7 +1178,8 @@ class UpdatePackageGeneralInformationTest(TestCase):
 
         # execute the task
         task = UpdatePackageGeneralInformation()
-        task.execute()
+        with self.assertNumQueries(25):
+            task.execute()
 
         # check that the task worked as expected
         pkgdata = PackageData.objects.get(
@@ -1256,14 +1197,19 @@ class TagPackagesWithBugsTest(TestCase):
     task.
     """
 
-    def setUp(self):
-        self.tag = 'tag:bugs'
-        self.package_with_bug = PackageName.objects.create(
-            name='package-with-bug')
-        self.package_without_bug = PackageName.objects.create(
-            name='package-without-bug')
-        self.bug_stats = PackageBugStats.objects.create(
-            package=self.package_with_bug,
+    @classmethod
+    def setUpTestData(cls):
+        cls.tag = 'tag:bugs'
+        names = ['package-with-bug', 'package-without-bug']
+        PackageName.objects.bulk_create([
+            PackageName(name=name) for name in names
+        ])
+        # bulk_create() does not set the primary keys on all backends
+        packages = PackageName.objects.in_bulk(names, field_name='name')
+        cls.package_with_bug, cls.package_without_bug = (
+            packages[name] for name in names)
+        cls.bug_stats = PackageBugStats.objects.create(
+            package=cls.package_with_bug,
             stats=[{'bug_count': 1, 'merged_count': 0, 'category_name': 'rc'}]
         )
 
@@ -1276,7 +1222,8 @@ class TagPackagesWithBugsTest(TestCase):
 
         # execute the task
         task = TagPackagesWithBugs()
-        task.execute()
+        with self.assertNumQueries(15):
+            task.execute()
 
         # check that the task worked as expected
         self.assertEqual(PackageData.objects.filter(key=self.tag).count(), 1)
@@ -13,15 +13,20 @@
 """
 Tests for the Distro Tracker core utils.
 """
+import copy
 import datetime
 import io
+import json
 import os
+import pickle
 import tempfile
+import threading
 import time
 from email import encoders
 from email.header import Header
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
+from email.utils import parseaddr
 from functools import partial
 from unittest import mock, skip
 
@@ -33,16 +38,26 @@ from django.test.utils import override_settings
 from django.urls import reverse
 from django.utils.http import http_date
 
+import gpg
+
+import requests
 from requests.exceptions import HTTPError
 
 import responses
 
+from distro_tracker.core.context_processors import DISTRO_TRACKER_EXTRAS
 from distro_tracker.core.models import PackageName, Repository
 from distro_tracker.core.utils import (
     PrettyPrintList,
     SpaceDelimitedTextField,
+    distro_tracker_render_to_string,
+    get_developer_information_url,
+    get_or_none,
+    get_vendor_developer_information_url,
     message_from_bytes,
+    message_from_file,
     now,
+    render_to_json_response,
     verify_signature,
     verp
 )
@@ -62,7 +77,9 @@ from distro_tracker.core.utils.email_messages import (
 from distro_tracker.core.utils.http import (
     HttpCache,
     get_resource_content,
+    get_resource_stream,
     get_resource_text,
+    parse_cache_control_header,
     safe_redirect
 )
 from distro_tracker.core.utils.linkify import (
@@ -180,6 +197,16 @@ Content-Transfer-Encoding: 8bit
         self.assertEqual(self.message_bytes, message.as_string())
         self.assertTrue(isinstance(message.as_string(), bytes))
 
+    def test_message_from_file(self):
+        """
+        Tests that a message parsed from a file is the same as when it is
+        parsed from bytes.
+        """
+        message = message_from_file(io.BytesIO(self.message_bytes))
+
+        self.assertEqual(self.message_bytes, message.as_string())
+        self.assertEqual(self.message_bytes, message.as_bytes())
+
     def test_get_payload_decode_idempotent(self):
         """
         Tests that the get_payload method returns bytes which can be decoded
@@ -309,6 +336,18 @@ class EmailUtilsTest(SimpleTestCase):
         email = extract_email_address_from_header(header)
         self.assertEqual(email, 'foo@domain.com')
 
+    def test_extract_email_address_from_header_bare_address(self):
+        """
+        Ensure bare addresses give the same result as parsing the full
+        header.
+        """
+        for header in ('foo@domain.com', ' foo.bar+baz@sub.domain.com\n',
+                       'foo@domain.com(Real Name)', 'foo.@domain.com',
+                       '"foo bar"@domain.com', 'foo@bar@domain.com'):
+            with self.subTest(header=header):
+                self.assertEqual(extract_email_address_from_header(header),
+                                 parseaddr(header)[1])
+
 
 class CustomEmailMessageTest(TestCase):
     """
@@ -354,6 +393,24 @@ class CustomEmailMessageTest(TestCase):
 
         self.assertIn(attachment, mail.outbox[0].message().get_payload())
 
+    def test_attachments_do_not_modify_original(self):
+        """
+        Tests that the attachments given to the ``CustomEmailMessage`` are
+        sent without being added to the original message.
+        """
+        msg = message_from_bytes(self.create_multipart().as_bytes())
+        attachment = self.prepare_part(b'new_data')
+        custom_message = CustomEmailMessage(
+            msg=msg, to=['recipient'], attachments=[attachment])
+
+        custom_message.send()
+
+        sent_message = mail.outbox[0].message()
+        self.assertIn(attachment, sent_message.get_payload())
+        self.assertIn(attachment.as_bytes(), sent_message.as_bytes())
+        self.assertNotIn(attachment, msg.get_payload())
+        self.assertEqual(len(msg.get_payload()), 1)
+
 
 class PrettyPrintListTest(SimpleTestCase):
     """
@@ -400,6 +457,19 @@ class PrettyPrintListTest(SimpleTestCase):
         # Comparable to plain lists?
         self.assertTrue(pp_list == ['a', 'q'])
         self.assertFalse(pp_list == ['a'])
+        # A real list
+        self.assertIsInstance(pp_list, list)
+
+    def test_copy(self):
+        """
+        Tests that a PrettyPrintList can be copied and pickled.
+        """
+        pp_list = PrettyPrintList(['a', 'q'], delimiter=', ')
+
+        for pp_copy in (copy.copy(pp_list), copy.deepcopy(pp_list),
+                        pickle.loads(pickle.dumps(pp_list))):
+            self.assertEqual(pp_copy, pp_list)
+            self.assertEqual(str(pp_copy), 'a, q')
 
 
 class SpaceDelimitedTextFieldTest(SimpleTestCase):
@@ -738,6 +808,21 @@ class HttpCacheTest(SimpleTestCase):
         self.assertTrue(os.path.isfile(new_path))
         self.assertTrue(os.path.isfile(new_path + '?headers'))
 
+    def test_known_directories_not_created_again(self):
+        """
+        Tests that the directories of a cached resource are only checked
+        once.
+        """
+        url = 'http://localhost/foo/bar'
+        self.assertNotIn(url, self.cache)
+
+        with mock.patch('distro_tracker.core.utils.http.os.makedirs') as m:
+            self.assertNotIn(url, self.cache)
+
+        m.assert_not_called()
+        self.assertTrue(
+            os.path.isdir(os.path.join(self.cache_directory, 'localhost/foo')))
+
     def test_update_cache_new_item(self):
         """
         Tests the simple case of updating the cache with a new URL's response.
@@ -754,14 +839,15 @@ class HttpCacheTest(SimpleTestCase):
         response, updated = self.cache.update(url)
 
         # The returned response is correct
-        self.assertEqual(b'Some content', response.content)
         self.assertEqual(200, response.status_code)
         # The return value indicates the cache has been updated
         self.assertTrue(updated)
         # The URL is now found in the cache
         self.assertTrue(url in self.cache)
-        # The content is accessible through the cache
+        # The content of the response is accessible through the cache
         self.assertEqual(b'Some content', self.cache.get_content(url))
+        with self.cache.get_content_stream(url) as stream:
+            self.assertEqual(b'Some content', stream.read())
         # The returned headers are accessible through the cache
         cached_headers = self.cache.get_headers(url)
         for key, value in headers.items():
@@ -788,6 +874,30 @@ class HttpCacheTest(SimpleTestCase):
 
         self.assertEqual(data, 'Some content')
 
+    def test_update_reuses_session_without_cookies(self):
+        """
+        Tests that all caches share the HTTP session of the thread, which
+        does not keep the cookies set by the servers.
+        """
+        self.mock_http_request(headers={'Set-Cookie': 'key=value; Path=/'})
+
+        with mock.patch('distro_tracker.core.utils.http.requests.Session',
+                        wraps=requests.Session) as mock_session:
+            with mock.patch('distro_tracker.core.utils.http._session_local',
+                            threading.local()):
+                self.cache.update('http://example.com/first')
+                HttpCache(self.cache_directory).update(
+                    'http://example.com/second')
+
+        mock_session.assert_called_once_with()
+        self.assertNotIn('Cookie', responses.calls[1].request.headers)
+
+    def test_get_content_not_cached(self):
+        url = 'http://example.com'
+
+        self.assertIsNone(self.cache.get_content_stream(url))
+        self.assertIsNone(self.cache.get_content(url))
+
     def test_cache_not_expired(self):
         """
         Tests that the cache knows a response is not expired based on its
@@ -818,6 +928,24 @@ class HttpCacheTest(SimpleTestCase):
         self.assertTrue(url in self.cache)
         self.assertTrue(self.cache.is_expired(url))
 
+    def test_cache_expiry_time_computed_once(self):
+        """
+        Tests that the freshness headers of a cached response are only parsed
+        once.
+        """
+        self.mock_http_request(headers={'Cache-Control': 'max-age=3600'})
+        url = 'http://example.com'
+        self.cache.update(url)
+
+        with mock.patch(
+            'distro_tracker.core.utils.http.parse_cache_control_header',
+            wraps=parse_cache_control_header
+        ) as mock_parse:
+            self.assertFalse(self.cache.is_expired(url))
+            self.assertFalse(self.cache.is_expired(url))
+
+        mock_parse.assert_called_once_with('max-age=3600')
+
     def test_cache_conditional_get_last_modified(self):
         """
         Tests that the cache performs a conditional GET request when asked to
@@ -902,6 +1030,33 @@ class HttpCacheTest(SimpleTestCase):
     #
     # Proper tests - Caching behaviour
     #
+    def test_get_headers_parsed_once(self):
+        """
+        Tests that the cached headers are kept in memory and only parsed
+        again once another cache instance has updated them.
+        """
+        self.mock_http_request(headers={'X-Custom-Field': 'value'})
+        url = 'http://example.com'
+        self.cache.update(url)
+
+        with mock.patch('distro_tracker.core.utils.http.json.load',
+                        wraps=json.load) as mock_load:
+            self.assertEqual(self.cache.get_headers(url)['x-custom-field'],
+                             'value')
+            self.assertTrue(self.cache.is_expired(url))
+            self.assertEqual(mock_load.call_count, 0)
+
+            responses.reset()
+            self.set_http_response(headers={'X-Custom-Field': 'new value'})
+            HttpCache(self.cache_directory).update(url, force=True)
+            mock_load.reset_mock()
+
+            self.assertEqual(self.cache.get_headers(url)['x-custom-field'],
+                             'new value')
+            self.assertEqual(self.cache.get_headers(url)['x-custom-field'],
+                             'new value')
+            self.assertEqual(mock_load.call_count, 1)
+
     def test_cache_remove_url(self):
         """
         Tests removing a cached response.
@@ -964,6 +1119,48 @@ class HttpCacheTest(SimpleTestCase):
         # The actual server's response is returned
         self.assertEqual(response.status_code, 304)
 
+    def test_conditional_get_not_modified_refreshes_response(self):
+        """
+        Tests that a 304 response restarts the age of the cached response
+        and stores its new freshness information.
+        """
+        self.mock_http_request()
+        url = 'http://example.com'
+        self.set_http_response(url, body='First', headers={
+            'ETag': '"1234"', 'Cache-Control': 'max-age=3600'})
+        self.cache.update(url)
+        header_file = self.cache._header_cache_file_path(url)
+        os.utime(header_file, (time.time() - 7200, time.time() - 7200))
+        self.assertTrue(self.cache.is_expired(url))
+
+        self.set_http_response(url, status_code=304, headers={
+            'Cache-Control': 'max-age=7200'})
+        self.cache.update(url)
+
+        self.assertFalse(self.cache.is_expired(url))
+        headers = self.cache.get_headers(url)
+        self.assertEqual(headers['Cache-Control'], 'max-age=7200')
+        self.assertEqual(headers['ETag'], '"1234"')
+        self.assertEqual(self.cache.get_content(url), b'First')
+
+    def test_revalidation_grace_period(self):
+        """
+        Tests that a response with only an ETag is not expired during the
+        revalidation grace period.
+        """
+        self.mock_http_request(headers={'ETag': '"1234"'})
+        url = 'http://example.com'
+        cache = HttpCache(self.cache_directory, revalidation_grace_period=60)
+        cache.update(url)
+
+        self.assertFalse(cache.is_expired(url))
+        # Without a grace period, the response is always revalidated
+        self.assertTrue(self.cache.is_expired(url))
+
+        header_file = cache._header_cache_file_path(url)
+        os.utime(header_file, (time.time() - 120, time.time() - 120))
+        self.assertTrue(cache.is_expired(url))
+
     def test_conditional_get_etag_expired(self):
         """
         Tests that the cache performs a conditional GET request when asked to
@@ -1228,6 +1425,31 @@ class HttpCacheTest(SimpleTestCase):
         # The expected content is now decoded in a string
         self.assertEqual(content, "Raphaël")
 
+    def test_get_resource_stream(self):
+        """
+        Tests the :func:`distro_tracker.core.utils.http.get_resource_stream`
+        utility function.
+        """
+        url = 'http://example.com/file.gz'
+        self.mock_http_request(body=self.compress(b'Line 1\nLine 2\n'))
+
+        with get_resource_stream(url, cache=self.cache, text=True) as stream:
+            self.assertEqual(list(stream), ['Line 1\n', 'Line 2\n'])
+
+    def test_get_resource_stream_only_if_updated(self):
+        """
+        Tests that :func:`distro_tracker.core.utils.http.get_resource_stream`
+        returns None when the resource has not been updated.
+        """
+        mock_cache = self.get_mock_of_http_cache()
+        mock_cache.is_expired.return_value = False
+
+        stream = get_resource_stream('http://some.url.com/', cache=mock_cache,
+                                     only_if_updated=True)
+
+        self.assertIsNone(stream)
+        mock_cache.get_content_stream.assert_not_called()
+
 
 class VerifySignatureTest(SimpleTestCase):
     """
@@ -1345,6 +1567,30 @@ class VerifySignatureTest(SimpleTestCase):
         # A message is logged about this bad key
         self.assertTrue(logger.warning.called)
 
+    def test_gpg_context_reused_for_same_keyring(self):
+        """
+        Ensures the GnuPG context is reused as long as the keyring directory
+        does not change.
+        """
+        self.import_key_into_keyring('key1.pub')
+        file_path = self.get_test_data_path('signed-message')
+        expected = [
+            ('PTS Tests', 'fake-address@domain.com')
+        ]
+
+        with mock.patch('distro_tracker.core.utils.gpg.Context',
+                        wraps=gpg.Context) as mock_context:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+            self.assertEqual(expected, verify_signature(content))
+            self.assertEqual(expected, verify_signature(content))
+
+            with self.settings(DISTRO_TRACKER_KEYRING_DIRECTORY=(
+                    self.get_temporary_directory())):
+                self.assertSequenceEqual([], verify_signature(content))
+
+        self.assertEqual(mock_context.call_count, 2)
+
 
 class DecodeHeaderTest(SimpleTestCase):
     """
@@ -1378,6 +1624,13 @@ class DecodeHeaderTest(SimpleTestCase):
     def test_decode_header_none(self):
         self.assertIsNone(decode_header(None))
 
+    def test_decode_header_unknown_charset(self):
+        """
+        Part encoded with a charset unknown to Python.
+        """
+        header_text = decode_header('=?x-unknown?q?M=FCnchen?=')
+        self.assertEqual('München', header_text)
+
 
 class AptCacheTests(TestCase):
     """
@@ -1723,6 +1976,19 @@ class UtilsTests(TestCase):
         """Ensure distro_tracker.core.utils.now() exists"""
         self.assertIsInstance(now(), datetime.datetime)
 
+    def test_get_or_none(self):
+        """
+        Ensures get_or_none returns the matching object or None, with a
+        single query.
+        """
+        package = PackageName.objects.create(name='dummy-package')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                get_or_none(PackageName, name='dummy-package'), package)
+        with self.assertNumQueries(1):
+            self.assertIsNone(get_or_none(PackageName, name='missing'))
+
     def test_get_data_checksum(self):
         """Ensures get_data_checksum behaves as expected."""
         checksum = get_data_checksum({})
@@ -1734,6 +2000,55 @@ class UtilsTests(TestCase):
         })
         self.assertEqual(checksum, '99914b932bd37a50b983c5e7c90ae93b')
 
+    @mock.patch('distro_tracker.core.utils.vendor.call')
+    def test_get_developer_information_url_cached(self, mock_vendor_call):
+        """
+        Ensures the vendor is asked only once for the URL of a developer.
+        """
+        get_vendor_developer_information_url.cache_clear()
+        self.addCleanup(get_vendor_developer_information_url.cache_clear)
+        mock_vendor_call.return_value = ('https://example.com/dev', True)
+
+        for _ in range(2):
+            self.assertEqual(
+                get_developer_information_url('dev-cached@example.com'),
+                'https://example.com/dev')
+
+        mock_vendor_call.assert_called_once_with(
+            'get_developer_information_url',
+            developer_email='dev-cached@example.com')
+
+    @mock.patch('distro_tracker.core.utils.render_to_string')
+    def test_distro_tracker_render_to_string(self, mock_render):
+        """
+        Ensures the distro-tracker extras are added to the rendering context
+        without modifying the given context.
+        """
+        context = {'key': 'value'}
+
+        distro_tracker_render_to_string('template.txt', context)
+
+        self.assertEqual(context, {'key': 'value'})
+        template_name, rendering_context = mock_render.call_args[0]
+        self.assertEqual(template_name, 'template.txt')
+        self.assertEqual(rendering_context['key'], 'value')
+        self.assertLessEqual(
+            DISTRO_TRACKER_EXTRAS.items(), rendering_context.items())
+
+    def test_render_to_json_response(self):
+        """
+        Ensures the object is serialized to compact UTF-8 encoded JSON.
+        """
+        data = {'name': 'Raphaël', 'packages': ['dpkg', 'apt']}
+
+        response = render_to_json_response(data)
+
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(
+            response.content,
+            '{"name":"Raphaël","packages":["dpkg","apt"]}'.encode('utf-8'))
+        self.assertEqual(json.loads(response.content), data)
+
     def test_safe_redirect_works(self):
         """Tests the default safe_url"""
 
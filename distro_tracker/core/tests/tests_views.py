@@ -158,6 +158,19 @@ class PackageViewTest(TestCase):
                              package_url(lib_package),
                              status_code=301)
 
+    def test_legacy_url_redirects_with_mismatched_hash(self):
+        """
+        Tests that old PTS style package URLs whose hash is not a strict
+        prefix of the package name are not redirected.
+        """
+        url_template = '/{hash}/{package}.html'
+
+        url = url_template.format(hash='q', package=self.package.name)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+        url = url_template.format(hash='libp', package='libp')
+        self.assertEqual(self.client.get(url).status_code, 404)
+
     def test_legacy_url_redirects_handles_bad_url(self):
         """
         Non regression test for a traceback generated with unexpected URL.
@@ -9,13 +9,14 @@
 # except according to the terms contained in the LICENSE file.
 """Various utilities for the distro-tracker project."""
 import datetime
+import functools
 import json
 import logging
-import os
+import threading
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.core.validators import EmailValidator
+from django.core.validators import validate_email
 from django.db import models
 from django.http import HttpResponse
 from django.template.loader import render_to_string
@@ -28,6 +29,7 @@ from distro_tracker import vendor
 from .email_messages import extract_email_address_from_header  # noqa
 from .email_messages import get_decoded_message_payload        # noqa
 from .email_messages import message_from_bytes                 # noqa
+from .email_messages import message_from_file                  # noqa
 
 logger_input = logging.getLogger('distro_tracker.input')
 
@@ -54,12 +56,13 @@ def distro_tracker_render_to_string(template_name, context=None):
     <distro_tracker.project.settings.TEMPLATE_CONTEXT_PROCESSORS> only work when
     using a :class:`RequestContext <django.template.RequestContext>`, whereas
     this function can be called independently from any HTTP request.
+
+    The given ``context`` is not modified.
     """
     from distro_tracker.core import context_processors
-    if context is None:
-        context = {}
-    extra_context = context_processors.DISTRO_TRACKER_EXTRAS
-    context.update(extra_context)
+    # Templates are parsed once thanks to the cached template loader, only
+    # the context needs to be built for each call
+    context = dict(context or {}, **context_processors.DISTRO_TRACKER_EXTRAS)
 
     return render_to_string(template_name, context)
 
@@ -75,17 +78,18 @@ def render_to_json_response(response):
         serializable by the :mod:`json` module.
     :rtype: :class:`HttpResponse <django.http.HttpResponse>`
     """
+    # Compact UTF-8 output, encoded once here rather than by HttpResponse
     return HttpResponse(
-        json.dumps(response),
+        json.dumps(response, ensure_ascii=False,
+                   separators=(',', ':')).encode('utf-8'),
         content_type='application/json'
     )
 
 
-class PrettyPrintList(object):
+class PrettyPrintList(list):
     """
-    A class which wraps the built-in :class:`list` object so that when it is
-    converted to a string, its contents are printed using the given
-    :attr:`delimiter`.
+    A subclass of the built-in :class:`list` object which, when converted to
+    a string, prints its contents using the given :attr:`delimiter`.
 
     The default delimiter is a space.
 
@@ -102,36 +106,18 @@ class PrettyPrintList(object):
     >>> a == ['1', '2', '3']
     False
     """
+    __slots__ = ('delimiter',)
+
     def __init__(self, the_list=None, delimiter=' '):
-        if the_list is None:
-            self._list = []
-        else:
-            self._list = the_list
+        super().__init__(() if the_list is None else the_list)
         self.delimiter = delimiter
 
-    def __getattr__(self, name, *args, **kwargs):
-        return getattr(self._list, name)
-
-    def __len__(self):
-        return len(self._list)
-
-    def __getitem__(self, pos):
-        return self._list[pos]
-
-    def __iter__(self):
-        return self._list.__iter__()
-
     def __str__(self):
-        return self.delimiter.join(map(str, self._list))
+        return self.delimiter.join(map(str, self))
 
     def __repr__(self):
         return str(self)
 
-    def __eq__(self, other):
-        if isinstance(other, PrettyPrintList):
-            return self._list == other._list
-        return self._list == other
-
 
 class SpaceDelimitedTextField(models.TextField):
     """
@@ -197,6 +183,24 @@ def get_vcs_name(shorthand):
     return VCS_SHORTHAND_TO_NAME.get(shorthand, shorthand)
 
 
+#: Per-thread storage of the GnuPG context used by :func:`verify_signature`
+_gpg_local = threading.local()
+
+
+def _get_gpg_context(keyring_directory):
+    """
+    Returns a :class:`gpg.Context` using the given keyring directory as its
+    home directory.
+
+    The context is kept and reused by the calling thread for as long as the
+    keyring directory does not change.
+    """
+    if getattr(_gpg_local, 'home_dir', None) != keyring_directory:
+        _gpg_local.context = gpg.Context(home_dir=keyring_directory)
+        _gpg_local.home_dir = keyring_directory
+    return _gpg_local.context
+
+
 def verify_signature(content):
     """
     The function extracts any possible signature information found in the given
@@ -224,71 +228,68 @@ def verify_signature(content):
     if isinstance(content, str):
         content = content.encode('utf-8')
 
-    os.environ['GNUPGHOME'] = keyring_directory
     signers = []
+    ctx = _get_gpg_context(keyring_directory)
 
-    with gpg.Context() as ctx:
+    # Try to verify the given content
+    signed_data = gpg.Data()
+    signed_data.new_from_mem(content)
 
-        # Try to verify the given content
-        signed_data = gpg.Data()
-        signed_data.new_from_mem(content)
+    try:
+        _, result = ctx.verify(signed_data)
+    except gpg.errors.BadSignatures:
+        return []
+    except gpg.errors.GpgError:
+        return None
 
-        try:
-            _, result = ctx.verify(signed_data)
-        except gpg.errors.BadSignatures:
-            return []
-        except gpg.errors.GpgError:
-            return None
+    # Prefer UIDs in the parent domain of the tracker
+    preferred_domain = settings.DISTRO_TRACKER_FQDN.partition('.')[2]
+    domain_suffix = '@' + preferred_domain if preferred_domain else None
 
-        # Extract signer information
-        for signature in result.signatures:
-            key_missing = bool(signature.summary &
-                               gpg.constants.SIGSUM_KEY_MISSING)
+    # Extract signer information
+    for signature in result.signatures:
+        key_missing = bool(signature.summary &
+                           gpg.constants.SIGSUM_KEY_MISSING)
 
-            if key_missing:
-                continue
+        if key_missing:
+            continue
 
-            key = ctx.get_key(signature.fpr)
-            preferred_domain = "".join(
-                settings.DISTRO_TRACKER_FQDN.split(".", 1)[1:2])
+        key = ctx.get_key(signature.fpr)
 
-            selected_uid = _select_uid_in_key(key, domain=preferred_domain)
-            if not selected_uid:
-                selected_uid = _select_uid_in_key(key)
+        selected_uid = _select_uid_in_key(key, domain_suffix=domain_suffix)
+        if not selected_uid:
+            selected_uid = _select_uid_in_key(key)
 
-            if selected_uid:
-                signers.append((selected_uid.name, selected_uid.email))
-            else:
-                logger_input.warning(
-                    'Key %s has no UID with a valid email (name=%s email=%s)',
-                    signature.fpr, key.uids[0].name, key.uids[0].email)
+        if selected_uid:
+            signers.append((selected_uid.name, selected_uid.email))
+        else:
+            logger_input.warning(
+                'Key %s has no UID with a valid email (name=%s email=%s)',
+                signature.fpr, key.uids[0].name, key.uids[0].email)
 
     return signers
 
 
-def _select_uid_in_key(key, domain=None):
+def _select_uid_in_key(key, domain_suffix=None):
     """
     Select the desired UID among all the available UIDs.
-    """
-    selected_uid = None
-    validate_email = EmailValidator()
 
+    :param domain_suffix: If given, only UIDs whose email ends with this
+        suffix (e.g. ``'@debian.org'``) are considered.
+    """
     for uid in key.uids:
         if uid.revoked or uid.invalid:
             continue
+        # Check the cheap domain condition before validating the email
+        if domain_suffix and not uid.email.endswith(domain_suffix):
+            continue
         try:
             validate_email(uid.email)
-            if domain:
-                if uid.email.endswith('@' + domain):
-                    selected_uid = uid
-                    break
-            else:
-                selected_uid = uid
-                break
         except ValidationError:
             continue
+        return uid
 
-    return selected_uid
+    return None
 
 
 def now(tz=datetime.timezone.utc):
@@ -303,6 +304,22 @@ def get_developer_information_url(email):
     """
     Returns developer's information url based on his/her email
     through vendor-specific function
+
+    The URLs are cached for each vendor, see
+    :func:`get_vendor_developer_information_url`.
+    """
+    return get_vendor_developer_information_url(
+        getattr(settings, 'DISTRO_TRACKER_VENDOR_RULES', None), email)
+
+
+@functools.lru_cache(maxsize=4096)
+def get_vendor_developer_information_url(vendor_rules, email):
+    """
+    Returns developer's information url for the given vendor rules module.
+
+    The results are cached since the same developers show up on many pages,
+    use ``get_vendor_developer_information_url.cache_clear()`` to empty the
+    cache.
     """
     info_url, implemented = vendor.call(
         'get_developer_information_url', **{'developer_email': email, })
@@ -331,12 +348,29 @@ def add_developer_extras(general, url_only=False):
             url = get_developer_information_url(uploader['email'])
             if url:
                 uploader['developer_info_url'] = url
-            if url_only:
-                continue
-            # Vendor specific extras.
-            extra, implemented = vendor.call(
-                'get_uploader_extra', uploader['email'], general['name'])
-            if implemented and extra:
-                uploader['extra'] = extra
+        if not url_only:
+            _add_uploader_extras(uploaders, general['name'])
 
     return general
+
+
+def _add_uploader_extras(uploaders, package_name):
+    """
+    Adds the vendor specific extras to the given uploaders, using the batched
+    ``get_uploader_extras`` vendor function when it is implemented.
+    """
+    extras, implemented = vendor.call(
+        'get_uploader_extras',
+        [uploader['email'] for uploader in uploaders], package_name)
+    if not implemented:
+        extras = {}
+        for uploader in uploaders:
+            extra, implemented = vendor.call(
+                'get_uploader_extra', uploader['email'], package_name)
+            if implemented:
+                extras[uploader['email']] = extra
+
+    for uploader in uploaders:
+        extra = (extras or {}).get(uploader['email'])
+        if extra:
+            uploader['extra'] = extra
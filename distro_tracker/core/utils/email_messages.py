@@ -16,10 +16,18 @@ import email
 import io
 import re
 import types
+from email.generator import BytesGenerator
 from email.mime.base import MIMEBase
+from email.utils import parseaddr
 
 from django.core.mail import EmailMessage
-from django.utils.encoding import force_bytes
+
+# Separator between the addresses of an address list
+_ADDRESS_SEPARATOR_RE = re.compile(r'(?<=>)\s*,\s*')
+# Line wrapping added to folded headers
+_HEADER_FOLDING_RE = re.compile(r'\r?\n(\s)', re.MULTILINE)
+# Bare address that parseaddr() would return unchanged
+_BARE_ADDRESS_RE = re.compile(r'[\w+-]+(?:\.[\w+-]+)*@[\w-]+(?:\.[\w-]+)*')
 
 
 def extract_email_address_from_header(header):
@@ -31,8 +39,10 @@ def extract_email_address_from_header(header):
     >>> str(extract_email_address_from_header('foo@domain.com'))
     'foo@domain.com'
     """
-    from email.utils import parseaddr
-    real_name, from_address = parseaddr(str(header))
+    header = str(header).strip()
+    if _BARE_ADDRESS_RE.fullmatch(header):
+        return header
+    real_name, from_address = parseaddr(header)
     return from_address
 
 
@@ -45,7 +55,6 @@ def name_and_address_from_string(content):
     is that this routine allows unquoted commas to appear in the real name
     (in violation of RFC822).
     """
-    from email.utils import parseaddr
     hacked_content = content.replace(",", "WEWANTNOCOMMAS")
     name, mail = parseaddr(hacked_content)
     if mail:
@@ -65,7 +74,7 @@ def names_and_addresses_from_string(content):
     """
     all_parts = [
         name_and_address_from_string(part)
-        for part in re.split(r'(?<=>)\s*,\s*', content)
+        for part in _ADDRESS_SEPARATOR_RE.split(content)
     ]
     return [
         part
@@ -98,6 +107,19 @@ def get_decoded_message_payload(message, default_charset='utf-8'):
         return payload.decode('latin1', 'replace')
 
 
+def _message_as_bytes(self, unixfrom=False, maxheaderlen=0, linesep='\n'):
+    """
+    Returns the payload of the message encoded as bytes.
+
+    Used as the ``as_string()`` and ``as_bytes()`` methods of the messages
+    patched by :func:`patch_message_for_django_compat`.
+    """
+    fp = io.BytesIO()
+    g = BytesGenerator(fp, mangle_from_=False, maxheaderlen=maxheaderlen)
+    g.flatten(self, unixfrom=unixfrom, linesep=linesep)
+    return fp.getvalue()
+
+
 def patch_message_for_django_compat(message):
     """
     Live patch the :py:class:`email.message.Message` object passed as
@@ -110,17 +132,7 @@ def patch_message_for_django_compat(message):
     """
     # Django expects patched versions of as_string/as_bytes, see
     # django/core/mail/message.py
-    def as_string(self, unixfrom=False, maxheaderlen=0, linesep='\n'):
-        """
-        Returns the payload of the message encoded as bytes.
-        """
-        from email.generator import BytesGenerator as Generator
-        fp = io.BytesIO()
-        g = Generator(fp, mangle_from_=False, maxheaderlen=maxheaderlen)
-        g.flatten(self, unixfrom=unixfrom, linesep=linesep)
-        return force_bytes(fp.getvalue(), 'utf-8')
-
-    message.as_string = types.MethodType(as_string, message)
+    message.as_string = types.MethodType(_message_as_bytes, message)
     message.as_bytes = message.as_string
     return message
 
@@ -139,8 +151,20 @@ def message_from_bytes(message_bytes):
     :class:`django.core.mail.SafeMIMEText` object but that we don't use
     in our :class:`CustomEmailMessage`).
     """
-    from email import message_from_bytes as email_message_from_bytes
-    message = email_message_from_bytes(message_bytes)
+    message = email.message_from_bytes(message_bytes)
+
+    return patch_message_for_django_compat(message)
+
+
+def message_from_file(message_file):
+    """
+    Returns a live-patched :class:`email.Message` object parsed from the given
+    binary file object, see :func:`message_from_bytes`.
+
+    The message is parsed while being read, which avoids keeping a copy of
+    the whole raw message in memory.
+    """
+    message = email.message_from_binary_file(message_file)
 
     return patch_message_for_django_compat(message)
 
@@ -152,8 +176,8 @@ def get_message_body(msg):
     :param msg: The original received package message
     :type msg: :py:class:`email.message.Message`
     """
-    return '\n'.join(get_decoded_message_payload(part)
-                     for part in msg.walk() if not part.is_multipart())
+    return '\n'.join([get_decoded_message_payload(part)
+                      for part in msg.walk() if not part.is_multipart()])
 
 
 class CustomEmailMessage(EmailMessage):
@@ -204,12 +228,19 @@ class CustomEmailMessage(EmailMessage):
         msg = self.msg
         if self.attachments:
             assert self.msg.is_multipart()
-            msg = copy.deepcopy(self.msg)
-            for attachment in self.attachments:
-                if isinstance(attachment, MIMEBase):
-                    msg.attach(attachment)
-                else:
-                    msg.attach(self._create_attachment(*attachment))
+            # Only the list of parts gets modified, no need to copy the
+            # parts themselves
+            msg = copy.copy(self.msg)
+            msg._payload = self.msg._payload + [
+                attachment if isinstance(attachment, MIMEBase)
+                else self._create_attachment(*attachment)
+                for attachment in self.attachments
+            ]
+            msg._headers = list(self.msg._headers)
+            if 'as_string' in vars(self.msg):
+                # Bind the methods patched by message_from_bytes() to the
+                # copy
+                patch_message_for_django_compat(msg)
         return msg
 
 
@@ -226,7 +257,7 @@ def decode_header(header, default_encoding='utf-8'):
         return None
     decoded_header = email.header.decode_header(header)
     # Join all the different parts of the header into a single unicode string
-    result = ''
+    result = []
     for part, encoding in decoded_header:
         if encoding == 'unknown-8bit':
             # Python 3 returns unknown-8bit instead of None when you have 8bit
@@ -235,12 +266,12 @@ def decode_header(header, default_encoding='utf-8'):
         if isinstance(part, bytes):
             encoding = encoding if encoding else default_encoding
             try:
-                result += part.decode(encoding)
-            except UnicodeDecodeError:
-                result += part.decode('iso-8859-1', 'replace')
+                result.append(part.decode(encoding))
+            except (UnicodeDecodeError, LookupError):
+                result.append(part.decode('iso-8859-1', 'replace'))
         else:
-            result += part
-    return result
+            result.append(part)
+    return ''.join(result)
 
 
 def unfold_header(header):
@@ -262,4 +293,4 @@ def unfold_header(header):
     """
     if header is None:
         return None
-    return re.sub(r'\r?\n(\s)', r'\1', str(header), 0, re.MULTILINE)
+    return _HEADER_FOLDING_RE.sub(r'\1', str(header))
@@ -11,15 +11,19 @@
 Utilities for handling HTTP resource access.
 """
 
+import collections
+import functools
+import http.cookiejar
 import json
 import os
 import re
+import shutil
+import threading
 import time
 from hashlib import md5
 
 from django.conf import settings
 from django.shortcuts import redirect
-from django.utils import timezone
 from django.utils.http import parse_http_date, url_has_allowed_host_and_scheme
 
 import requests
@@ -27,6 +31,31 @@ from requests.structures import CaseInsensitiveDict
 
 from .compression import get_uncompressed_stream, guess_compression_method
 
+_URL_SCHEME_RE = re.compile(r'^https?://', re.IGNORECASE)
+_TRAILING_QUESTION_MARK_RE = re.compile(r'\?$')
+_MULTIPLE_SLASHES_RE = re.compile(r'/+')
+_TRAILING_SLASHES_RE = re.compile(r'/+$')
+# HTTP sessions of the threads, see _get_session()
+_session_local = threading.local()
+# Headers of a 304 response which refresh the cached response
+_FRESHNESS_HEADERS = ('cache-control', 'date', 'etag', 'expires',
+                      'last-modified')
+
+
+def _get_session():
+    """
+    Returns the :class:`requests.Session` of the calling thread, which keeps
+    the connections alive across all HTTP caches.
+
+    Like with :func:`requests.get`, cookies are not kept between requests.
+    """
+    session = getattr(_session_local, 'session', None)
+    if session is None:
+        session = _session_local.session = requests.Session()
+        session.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
 
 def parse_cache_control_header(header):
     """
@@ -37,27 +66,59 @@ def parse_cache_control_header(header):
         is used instead.
     :rtype: dict
     """
-    parts = header.split(',')
     cache_control = {}
-    for part in parts:
-        part = part.strip()
-        if '=' not in part:
-            cache_control[part] = None
-            continue
-        key, value = part.split('=', 1)
-        cache_control[key] = value
+    for part in header.split(','):
+        key, separator, value = part.strip().partition('=')
+        cache_control[key] = value if separator else None
 
     return cache_control
 
 
+@functools.lru_cache(maxsize=4096)
+def _url_to_relative_path(url):
+    """
+    Normalizes the URL into a sane relative path. The result only depends
+    on the URL, so it is cached.
+    """
+    path = _URL_SCHEME_RE.sub('', url, count=1)
+    path = _TRAILING_QUESTION_MARK_RE.sub('', path)
+    path = _MULTIPLE_SLASHES_RE.sub('/', path)
+    path = _TRAILING_SLASHES_RE.sub('', path)
+
+    # Handle URL with GET parameters to allow caching of multiple versions
+    # of the same path
+    if '?' in path:
+        (url, args) = path.split('?', maxsplit=1)
+        # Not a security boundary, this keeps md5 usable in FIPS mode
+        digest = md5(args.encode('utf-8'), usedforsecurity=False)
+        path = url + '?/' + digest.hexdigest()
+
+    return path
+
+
 class HttpCache(object):
     """
     A class providing an interface to a cache of HTTP responses.
+
+    :param revalidation_grace_period: If given, the number of seconds
+        during which a cached response without any freshness information,
+        but with an ETag or a Last-Modified header, is not considered
+        expired. By default such responses are always revalidated.
     """
+    #: The maximum number of parsed headers kept in memory
+    headers_cache_size = 1024
+
     def __init__(self, cache_directory_path,
-                 url_to_cache_path=None):
+                 url_to_cache_path=None, revalidation_grace_period=None):
         self.cache_directory_path = cache_directory_path
         self.custom_url_to_cache_path = url_to_cache_path
+        self.revalidation_grace_period = revalidation_grace_period
+        # Maps URLs to the stat signature and the parsed content of their
+        # header file, and to the expiry time of the response once known,
+        # least recently used first
+        self._headers_cache = collections.OrderedDict()
+        # Directories known to exist in the cache
+        self._known_directories = set()
 
     def __contains__(self, item):
         cache_file_name = self._content_cache_file_path(item)
@@ -67,33 +128,43 @@ class HttpCache(object):
         """
         If the cached response for the given URL is expired based on
         Cache-Control or Expires headers, returns True.
+
+        Responses which only have validators are considered fresh during
+        the :attr:`revalidation_grace_period`.
         """
-        if url not in self:
+        entry = self._load_headers(url, *self._paths(url))
+        if entry is None:
             return True
-        headers = self.get_headers(url)
+        signature, headers, expiry_time = entry
+        if expiry_time is None:
+            # Computed once for each version of the header file
+            expiry_time = self._expiry_time(signature[0] // 10**9, headers)
+            self._headers_cache[url] = (signature, headers, expiry_time)
 
+        return time.time() >= expiry_time
+
+    def _expiry_time(self, stored_time, headers):
+        """
+        Returns the timestamp from which a response stored (or last
+        revalidated) at ``stored_time`` with the given headers is expired.
+        """
         # First check if the Cache-Control header has set a max-age
         if 'cache-control' in headers:
             cache_control = parse_cache_control_header(headers['cache-control'])
             if 'max-age' in cache_control:
-                max_age = int(cache_control['max-age'])
-                response_age = int(
-                    os.stat(self._header_cache_file_path(url)).st_mtime)
-                current_timestamp = int(time.time())
-
-                return current_timestamp - response_age >= max_age
+                return stored_time + int(cache_control['max-age'])
 
         # Alternatively, try the Expires header
         if 'expires' in headers:
-            expires_date = timezone.datetime.utcfromtimestamp(
-                parse_http_date(headers['expires']))
-            expires_date = timezone.make_aware(expires_date, timezone.utc)
-            current_date = timezone.now()
+            return parse_http_date(headers['expires'])
 
-            return current_date > expires_date
+        # Skip the revalidation of recent responses which have validators
+        if (self.revalidation_grace_period and
+                ('etag' in headers or 'last-modified' in headers)):
+            return stored_time + self.revalidation_grace_period
 
         # If there is no cache freshness date consider the item expired
-        return True
+        return 0
 
     def get_content_stream(self, url, compression="auto", text=False):
         """
@@ -102,15 +173,21 @@ class HttpCache(object):
         If the file is compressed, the file-like object will read the
         decompressed stream.
         """
-        if url in self:
-            if compression == "auto":
-                compression = guess_compression_method(url)
-
+        try:
             # XXX: we leak temp_file... cf skipped test in test suite
             # of get_uncompressed_stream
             temp_file = open(self._content_cache_file_path(url), 'rb')
+        except FileNotFoundError:
+            return None
+
+        if compression == "auto":
+            compression = guess_compression_method(url)
+        try:
             return get_uncompressed_stream(temp_file, compression=compression,
                                            text=text)
+        except BaseException:
+            temp_file.close()
+            raise
 
     def get_content(self, url, compression="auto"):
         """
@@ -127,29 +204,67 @@ class HttpCache(object):
         :rtype: :class:`bytes`
 
         """
-        if url in self:
-            with self.get_content_stream(url, compression=compression) as f:
+        stream = self.get_content_stream(url, compression=compression)
+        if stream is not None:
+            with stream as f:
                 return f.read()
 
     def get_headers(self, url):
         """
         Returns the HTTP headers of the cached response for the given URL.
 
+        The parsed headers are kept in memory and only read again when the
+        header file changes.
+
         :rtype: dict
         """
-        if url in self:
-            with open(self._header_cache_file_path(url), 'r') as header_file:
-                return CaseInsensitiveDict(json.load(header_file))
-        else:
+        entry = self._load_headers(url, *self._paths(url))
+        if entry is None:
             return {}
 
+        return entry[1].copy()
+
+    def _load_headers(self, url, content_path, header_file_path):
+        """
+        Returns the entry of the headers cache for the given URL, loading
+        the header file if needed: the stat signature of the file, its
+        parsed headers, which must not be modified, and the expiry time of
+        the response if it is known.
+
+        Returns ``None`` if the URL is not cached.
+        """
+        if not os.path.exists(content_path):
+            return None
+
+        stat = os.stat(header_file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._headers_cache.get(url)
+        if cached is not None and cached[0] == signature:
+            self._headers_cache.move_to_end(url)
+            return cached
+
+        with open(header_file_path, 'r') as header_file:
+            headers = CaseInsensitiveDict(json.load(header_file))
+        return self._store_headers(url, signature, headers)
+
+    def _store_headers(self, url, signature, headers):
+        entry = self._headers_cache[url] = (signature, headers, None)
+        self._headers_cache.move_to_end(url)
+        if len(self._headers_cache) > self.headers_cache_size:
+            self._headers_cache.popitem(last=False)
+        return entry
+
     def remove(self, url):
         """
         Removes the cached response for the given URL.
         """
-        if url in self:
-            os.remove(self._content_cache_file_path(url))
-            os.remove(self._header_cache_file_path(url))
+        self._remove(url, *self._paths(url))
+
+    def _remove(self, url, content_path, header_file_path):
+        self._headers_cache.pop(url, None)
+        if os.path.exists(content_path):
+            os.remove(content_path)
+            os.remove(header_file_path)
 
     def update(self, url, force=False, invalidate_cache=True):
         """
@@ -160,11 +275,19 @@ class HttpCache(object):
         :param force: To force the method to perform a full GET request, set
             the parameter to ``True``
 
+        The body of a new response is streamed to the cache, so the content
+        of the returned response has already been consumed when the cache
+        was updated: use :meth:`get_content` or :meth:`get_content_stream`
+        to access it.
+
         :returns: The original HTTP response and a Boolean indicating whether
             the cached value was updated.
         :rtype: two-tuple of (:class:`requests.Response`, ``Boolean``)
         """
-        cached_headers = self.get_headers(url)
+        content_path, header_file_path = self._paths(url)
+        entry = self._load_headers(url, content_path, header_file_path)
+        # Shared with the headers cache, must not be modified
+        cached_headers = entry[1] if entry is not None else {}
         headers = {}
         if not force:
             if 'last-modified' in cached_headers:
@@ -176,28 +299,77 @@ class HttpCache(object):
             headers['Cache-Control'] = 'no-cache'
 
         verify = settings.DISTRO_TRACKER_CA_BUNDLE or True
-        response = requests.get(url, headers=headers, verify=verify,
-                                allow_redirects=True)
+        response = _get_session().get(url, headers=headers, verify=verify,
+                                      allow_redirects=True, stream=True)
 
         # Invalidate previously cached value if the response is not valid now
         if not response.ok:
             if invalidate_cache:
-                self.remove(url)
+                self._remove(url, content_path, header_file_path)
         elif response.status_code == 200:
             # Dump the content and headers only if a new response is generated
-            with open(self._content_cache_file_path(url), 'wb') as content_file:
-                content_file.write(response.content)
-            with open(self._header_cache_file_path(url), 'w') as header_file:
-                json.dump(dict(response.headers), header_file)
+            self._write_content(content_path, response)
+            self._write_headers(url, header_file_path, response.headers)
+        elif response.status_code == 304 and entry is not None:
+            # The cached response is still valid, store its new freshness
+            # information and restart its age
+            new_headers = cached_headers.copy()
+            new_headers.update(
+                (name, value) for name, value in response.headers.items()
+                if name.lower() in _FRESHNESS_HEADERS)
+            self._write_headers(url, header_file_path, new_headers)
+
+        if response.status_code != 200:
+            # Read the (small) body to release the connection to the pool
+            response.content
 
         return response, response.status_code != 304
 
+    def _write_headers(self, url, header_file_path, headers):
+        # A single write, json.dump() writes each encoded chunk separately
+        with open(header_file_path, 'w') as header_file:
+            header_file.write(json.dumps(dict(headers)))
+        # Keep the written headers in memory instead of parsing them again
+        stat = os.stat(header_file_path)
+        self._store_headers(url, (stat.st_mtime_ns, stat.st_size),
+                            CaseInsensitiveDict(headers))
+
+    def _write_content(self, content_path, response):
+        # Write to a temporary file so that readers never see a partial
+        # content. Cache paths never end with '?tmp' as the query string of
+        # URLs is turned into a '?/<md5sum>' component.
+        temp_path = content_path + '?tmp'
+        try:
+            with open(temp_path, 'wb') as content_file:
+                # Copy straight from the raw stream, still decoding any
+                # transport compression
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, content_file, 1 << 20)
+            os.replace(temp_path, content_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
     def _prepare_path(self, cache_path):
         path = self.cache_directory_path
         dirname = os.path.dirname(cache_path)
+        full_path = os.path.join(path, cache_path)
+
+        if dirname in self._known_directories:
+            return full_path
+        # Expected case, no file conflicts with the directory tree
+        try:
+            os.makedirs(os.path.join(path, dirname), exist_ok=True)
+        except (FileExistsError, NotADirectoryError):
+            self._resolve_path_conflicts(dirname)
+        self._known_directories.add(dirname)
 
+        return full_path
+
+    def _resolve_path_conflicts(self, dirname):
         # Check the directory tree, create missing directories
-        check_dir = path
+        check_dir = self.cache_directory_path
         for component in dirname.split(os.path.sep):
             check_dir = os.path.join(check_dir, component)
             if os.path.isdir(check_dir):
@@ -215,16 +387,20 @@ class HttpCache(object):
                               os.path.join(target_directory, 'index?headers'))
             os.mkdir(check_dir)
 
-        return os.path.join(self.cache_directory_path, cache_path)
+    def _paths(self, url):
+        """
+        Returns the paths of the content and header files of the given URL,
+        which share the same directory.
+        """
+        path = self._content_cache_file_path(url)
+        return path, path + '?headers'
 
     def _content_cache_file_path(self, url):
         path = self._prepare_path(self.url_to_cache_path(url))
         return path
 
     def _header_cache_file_path(self, url):
-        header_cache_path = self.url_to_cache_path(url) + '?headers'
-        path = self._prepare_path(header_cache_path)
-        return path
+        return self._paths(url)[1]
 
     def url_to_cache_path(self, url):
         """
@@ -243,17 +419,7 @@ class HttpCache(object):
         if self.custom_url_to_cache_path:
             return self.custom_url_to_cache_path(url)
 
-        # Normalizes URL into a sane path
-        path = re.sub(r'^https?://', '', url, count=1, flags=re.IGNORECASE)
-        path = re.sub(r'\?$', '', path)
-        path = re.sub(r'/+', '/', path)
-        path = re.sub(r'/+$', '', path)
-
-        # Handle URL with GET parameters to allow caching of multiple versions
-        # of the same path
-        if '?' in path:
-            (url, args) = path.split('?', maxsplit=1)
-            path = url + '?/' + md5(args.encode('utf-8')).hexdigest()
+        path = _url_to_relative_path(url)
 
         # Hande conflicting directory that will forbid save of the cache file
         if os.path.isdir(os.path.join(self.cache_directory_path, path)):
@@ -306,6 +472,43 @@ def get_resource_content(url, cache=None, compression="auto",
     :returns: The bytes representation of the resource found at the given url
     :rtype: bytes
     """
+    cache = _update_resource(url, cache, only_if_updated, force_update,
+                             ignore_network_failures, ignore_http_error)
+    if cache is not None:
+        return cache.get_content(url, compression=compression)
+
+
+def get_resource_stream(url, cache=None, compression="auto", text=False,
+                        only_if_updated=False, force_update=False,
+                        ignore_network_failures=False, ignore_http_error=None):
+    """
+    Clone of :py:func:`get_resource_content` which returns a file-like object
+    reading the resource instead of its whole content. It should be preferred
+    for large resources which can be parsed incrementally. It supports the
+    same parameters and adds the text parameter.
+
+    :param text: If True, the stream returns text instead of bytes.
+    :type text: bool
+
+    :returns: A file-like object reading the resource found at the given url,
+        which the caller has to close.
+    """
+    cache = _update_resource(url, cache, only_if_updated, force_update,
+                             ignore_network_failures, ignore_http_error)
+    if cache is not None:
+        return cache.get_content_stream(url, compression=compression,
+                                        text=text)
+
+
+def _update_resource(url, cache, only_if_updated, force_update,
+                     ignore_network_failures, ignore_http_error):
+    """
+    Updates the cached copy of the resource if needed, see
+    :py:func:`get_resource_content` for the parameters.
+
+    :returns: The cache to read the resource from, or ``None`` if nothing
+        should be returned to the caller.
+    """
     if cache is None:
         cache_directory_path = settings.DISTRO_TRACKER_CACHE_DIRECTORY
         cache = HttpCache(cache_directory_path)
@@ -333,7 +536,7 @@ def get_resource_content(url, cache=None, compression="auto",
         if only_if_updated:
             return  # Stop without returning old data
 
-    return cache.get_content(url, compression=compression)
+    return cache
 
 
 def get_resource_text(*args, **kwargs):
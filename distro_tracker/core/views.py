@@ -92,6 +92,9 @@ def legacy_package_url_redirect(request, package_hash, package_name):
     .. note::
        The "old" package URL is: /<hash>/<package_name>.html
     """
+    if (len(package_name) <= len(package_hash) or
+            not package_name.startswith(package_hash)):
+        raise Http404
     return redirect('dtracker-package-page', package_name=package_name,
                     permanent=True)
 
@@ -239,6 +242,9 @@ def legacy_rss_redirect(request, package_hash, package_name):
     """
     Redirects old package RSS news feed URLs to the new ones.
     """
+    if (len(package_name) <= len(package_hash) or
+            not package_name.startswith(package_hash)):
+        raise Http404
     return redirect(
         'dtracker-package-rss-news-feed',
         package_name=package_name,
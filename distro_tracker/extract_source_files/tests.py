@@ -15,6 +15,8 @@ Tests for the :mod:`distro_tracker.extract_source_files` app.
 
 import itertools
 import os
+import shutil
+import tempfile
 from pathlib import Path
 from unittest import mock
 
@@ -34,6 +36,28 @@ class ExtractSourcePackageFilesTest(TestCase):
     Tests for the task
     :class:`distro_tracker.extract_source_files.ExtractSourcePackageFiles`.
     """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Default debian directory, copied by the tests which need it
+        cls.template_directory = tempfile.mkdtemp(prefix='dtracker-debian-')
+        cls.addClassCleanup(shutil.rmtree, cls.template_directory,
+                            ignore_errors=True)
+        cls._create_debian_dir(cls.template_directory,
+                               ExtractSourcePackageFiles.ALL_FILES_TO_EXTRACT)
+
+    @staticmethod
+    def _create_debian_dir(pkg_directory, files_to_create, extra_files=(),
+                           contents=b'Contents'):
+        debian_dir = os.path.join(pkg_directory, 'debian')
+        os.makedirs(debian_dir)
+        for file_name in itertools.chain(files_to_create, extra_files):
+            file_path = os.path.join(debian_dir, file_name)
+            with open(file_path, 'wb') as f:
+                f.write(contents)
+
+        return debian_dir
+
     def setUp(self):
         self.task = ExtractSourcePackageFiles()
         self.srcpkg = self.create_source_package()
@@ -52,17 +76,16 @@ class ExtractSourcePackageFilesTest(TestCase):
 
     def setup_debian_dir(self, pkg_directory, files_to_create=None,
                          extra_files=[], contents=b'Contents'):
-        debian_dir = os.path.join(pkg_directory, 'debian')
-        os.makedirs(debian_dir)
+        if (files_to_create is None and not extra_files and
+                contents == b'Contents'):
+            return shutil.copytree(
+                os.path.join(self.template_directory, 'debian'),
+                os.path.join(pkg_directory, 'debian'))
+
         if files_to_create is None:
             files_to_create = self.task.ALL_FILES_TO_EXTRACT
-
-        for file_name in itertools.chain(files_to_create, extra_files):
-            file_path = os.path.join(debian_dir, file_name)
-            with open(file_path, 'wb') as f:
-                f.write(contents)
-
-        return debian_dir
+        return self._create_debian_dir(pkg_directory, files_to_create,
+                                       extra_files, contents)
 
     def assertExtractedFilesInDB(self, expected=None):
         if expected is None:
@@ -15,7 +15,7 @@ import sys
 
 from django.core.management.base import BaseCommand
 
-from distro_tracker.core.utils.email_messages import message_from_bytes
+from distro_tracker.core.utils.email_messages import message_from_file
 from distro_tracker.mail.processor import MailProcessor
 
 
@@ -33,6 +33,6 @@ class Command(BaseCommand):
             self.input_file = self.input_file.detach()
         except io.UnsupportedOperation:
             pass
-        msg = message_from_bytes(self.input_file.read())
+        msg = message_from_file(self.input_file)
         handler = MailProcessor(msg)
         handler.process()
@@ -18,7 +18,7 @@ import sys
 
 from django.core.management.base import BaseCommand
 
-from distro_tracker.core.utils import message_from_bytes
+from distro_tracker.core.utils import message_from_file
 from distro_tracker.mail.dispatch import classify_message
 
 logger = logging.getLogger(__name__)
@@ -30,9 +30,7 @@ class Command(BaseCommand):
     def handle(self, *args, **kwargs):
         logger.info("Processing a received message")
         # Make sure to read binary data.
-        input_data = self.input_file.detach().read()
-
-        msg = message_from_bytes(input_data)
+        msg = message_from_file(self.input_file.detach())
         pkg, keyword = classify_message(msg)
 
         logger.info('Completed processing a received message for %s/%s',
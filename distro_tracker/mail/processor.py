@@ -24,7 +24,7 @@ import pyinotify
 
 import distro_tracker.mail.control
 import distro_tracker.mail.dispatch
-from distro_tracker.core.utils import message_from_bytes
+from distro_tracker.core.utils import message_from_file
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +80,7 @@ class MailProcessor(object):
         :param str filename: Path of the file to parse as mail.
         """
         with open(filename, 'rb') as f:
-            self.message = message_from_bytes(f.read())
+            self.message = message_from_file(f)
 
     @staticmethod
     def find_delivery_address(message):
@@ -124,6 +124,15 @@ of those settings.
     The email address which should receive bounces that are likely the
     result of incoming spam.
 
+:py:data:`DISTRO_TRACKER_EXTENSION_URLCONFS`
+    The list of modules whose ``urlpatterns`` are added to the URL routes
+    of the project. Defaults to the ``tracker_urls`` modules shipped with
+    distro-tracker by the installed applications (``distro_tracker.core``,
+    ``distro_tracker.derivative`` and ``distro_tracker.vendor.debian``).
+    Installed applications are not probed for other modules: a third-party
+    application providing a ``tracker_urls`` module must be added to this
+    setting for its URLs to be routed.
+
 More settings:
 
 """
@@ -466,6 +475,11 @@ _COMPUTE_DEFAULT_SETTINGS = (
      lambda t: os.path.join(t['DISTRO_TRACKER_DATA_PATH'], 'logs')),
     ('DISTRO_TRACKER_MAILDIR_DIRECTORY',
      lambda t: os.path.join(t['DISTRO_TRACKER_DATA_PATH'], 'maildir')),
+    ('DISTRO_TRACKER_EXTENSION_URLCONFS',
+     lambda t: [app + '.tracker_urls' for app in t['INSTALLED_APPS']
+                if app in ('distro_tracker.core',
+                           'distro_tracker.derivative',
+                           'distro_tracker.vendor.debian')]),
 )
 
 
@@ -38,7 +38,6 @@ CACHES = {
 TEMPLATES = defaults.TEMPLATES.copy()
 TEMPLATES[0] = TEMPLATES[0].copy()
 TEMPLATES[0]['OPTIONS'] = TEMPLATES[0]['OPTIONS'].copy()
-TEMPLATES[0]['OPTIONS']['loaders'] = TEMPLATES[0]['OPTIONS']['loaders'].copy()
 TEMPLATES[0]['OPTIONS']['loaders'] = [
     'django.template.loaders.filesystem.Loader',
     'django.template.loaders.app_directories.Loader',
@@ -33,6 +33,10 @@ LOGGING = {
 INSTALLED_APPS = defaults.INSTALLED_APPS.copy()
 MIDDLEWARE = defaults.MIDDLEWARE
 
+# Restore the cached template loader, templates are rendered many times
+# during the test suite and test template directories reset the cache
+TEMPLATES = defaults.TEMPLATES
+
 TEST_NON_SERIALIZED_APPS = [
     'django.contrib.contenttypes'
 ]
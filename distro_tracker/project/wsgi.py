@@ -26,6 +26,7 @@ framework.
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 # We defer to a DJANGO_SETTINGS_MODULE already in the environment. This breaks
 # if running multiple sites in the same mod_wsgi process. To fix this, use
@@ -39,6 +40,10 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE",
 # setting points here.
 application = get_wsgi_application()
 
+# Import the URLconf and build the resolver's lookup tables now instead of
+# during the first request handled by each worker.
+get_resolver().reverse_dict
+
 # Apply WSGI middleware here.
 # from helloworld.wsgi import HelloWorldApplication
 # application = HelloWorldApplication(application)
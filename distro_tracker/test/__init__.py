@@ -227,7 +227,8 @@ class DatabaseMixin(object):
         except obj.__class__.DoesNotExist as error:
             raise AssertionError(error)
 
-    def create_source_package(self, **kwargs):
+    @classmethod
+    def create_source_package(cls, **kwargs):
         """
         Creates a source package and any related object requested through the
         keyword arguments. The following arguments are supported:
@@ -288,15 +289,16 @@ class DatabaseMixin(object):
         if 'repository' in kwargs:
             kwargs.setdefault('repositories', [kwargs['repository']])
         for repo_shorthand in kwargs.get('repositories', []):
-            self.add_to_repository(srcpkg, repo_shorthand)
+            cls.add_to_repository(srcpkg, repo_shorthand)
 
         if 'data' in kwargs:
-            self.add_package_data(srcpkg.source_package_name, **kwargs['data'])
+            cls.add_package_data(srcpkg.source_package_name, **kwargs['data'])
 
         srcpkg.save()
         return srcpkg
 
-    def add_to_repository(self, srcpkg, shorthand='default'):
+    @classmethod
+    def add_to_repository(cls, srcpkg, shorthand='default'):
         """
         Add a source package to a repository. Creates the repository if it
         doesn't exist.
@@ -326,7 +328,8 @@ class DatabaseMixin(object):
         return srcpkg.repository_entries.create(repository=repository,
                                                 component='main')
 
-    def remove_from_repository(self, srcpkg, shorthand='default'):
+    @classmethod
+    def remove_from_repository(cls, srcpkg, shorthand='default'):
         """
         Remove a source package from a repository.
 
@@ -337,7 +340,8 @@ class DatabaseMixin(object):
         return srcpkg.repository_entries.filter(
             repository__shorthand=shorthand).delete()[0]
 
-    def add_package_data(self, pkgname, **kwargs):
+    @classmethod
+    def add_package_data(cls, pkgname, **kwargs):
         """
         Creates PackageData objects associated to the package indicated
         in pkgname. Each named parameter results in PackageData instance